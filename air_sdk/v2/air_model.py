@@ -6,7 +6,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, fields, asdict, Field, is_dataclass, InitVar
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import (
     Union,
     Any,
@@ -42,6 +42,16 @@ SpecialField = Mapping[str, object]
 DataDict = Dict[str, Any]
 
 
+@lru_cache(maxsize=None)
+def _get_model_type_hints(model: Type[BaseModel]) -> DataDict:
+    """Returns the resolved type hints of a model class.
+
+    Endpoint APIs are instantiated often, so hints are resolved once per model class.
+    The returned mapping is shared and must not be mutated.
+    """
+    return get_type_hints(model)
+
+
 def _generate_special_field() -> SpecialField:
     """Returns a unique mapping reserved for assignment of `metadata` for special `BaseModel` fields."""
     return {'property': object()}
@@ -233,7 +243,7 @@ class BaseEndpointApi(EndpointMethodMixin, Generic[TAirModel_co]):
 
     @cached_property
     def model_cls_type_hints(self) -> DataDict:
-        return get_type_hints(self.model)
+        return _get_model_type_hints(self.model)
 
     @cached_property
     def model_cls_fields(self) -> Tuple[Field[Any], ...]:
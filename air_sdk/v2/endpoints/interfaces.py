@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from http import HTTPStatus
 from typing import Optional, List, Dict, Union, Any, Iterator, Type, TYPE_CHECKING
@@ -11,7 +10,7 @@ from typing import Optional, List, Dict, Union, Any, Iterator, Type, TYPE_CHECKI
 from air_sdk.util import raise_if_invalid_response
 
 from air_sdk.v2.endpoints import mixins
-from air_sdk.v2.endpoints.mixins import serialize_payload
+from air_sdk.v2.endpoints.mixins import serialize_payload, to_serializable
 
 from air_sdk.v2.endpoints.nodes import Node
 from air_sdk.v2.endpoints.simulations import Simulation
@@ -201,7 +200,7 @@ class LinkEndpointApi(mixins.ListApiMixin[Link], BaseEndpointApi[Link]):
             raise ValueError('`simulation` must be specified')
         if isinstance(links, list) and len(links) == 0:
             raise ValueError('If `links` is provided it must be a non-empty list.')
-        params = json.loads(serialize_payload({'simulation': simulation, 'links': links}))
+        params = to_serializable({'simulation': simulation, 'links': links})
         link_id_list = params.pop('links')
         if isinstance(link_id_list, list):
             params['ids'] = ','.join(link_id_list)
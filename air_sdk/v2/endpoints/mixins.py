@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
-import json
 from http import HTTPStatus
 from typing import Optional, Any, TypedDict, List, Callable, Iterator, TYPE_CHECKING, Dict, Generic
 
@@ -15,9 +14,51 @@ if TYPE_CHECKING:
     from air_sdk.v2 import AirApi
 
 
+_encoder = AirJSONEncoder(separators=(',', ':'))
+
+
 def serialize_payload(data: Dict[str, Any] | List[Dict[str, Any]]) -> str:
     """Serialize the dictionary of values into json using the AirJSONEncoder."""
-    return json.dumps(data, indent=None, separators=(',', ':'), cls=AirJSONEncoder)
+    return _encoder.encode(data)
+
+
+def _serializable_key(key: Any) -> str:
+    """Convert a dictionary key into a string the same way the `json` module does."""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
+
+
+def to_serializable(data: Any) -> Any:
+    """Convert the data into JSON-compatible python objects using the AirJSONEncoder.
+
+    This is equivalent to `json.loads(serialize_payload(data))`, without encoding the data
+    into a json string and parsing it back.
+    """
+    if isinstance(data, dict):
+        return {_serializable_key(key): to_serializable(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [to_serializable(item) for item in data]
+    if data is None or isinstance(data, bool):
+        return data
+    # Subclasses (e.g. `str`/`int` enums) are encoded by `json` as their plain values
+    if isinstance(data, str):
+        return str.__str__(data)
+    if isinstance(data, int):
+        return int.__int__(data)
+    if isinstance(data, float):
+        return float.__float__(data)
+    return to_serializable(_encoder.default(data))
 
 
 class BaseApiMixin:
@@ -50,7 +91,7 @@ class ListApiMixin(BaseApiMixin, Generic[TAirModel_co]):
         # Set up pagination
         next_url = None
         params.setdefault('limit', self.__api__.client.pagination_page_size)
-        params = json.loads(serialize_payload(params))  # Accounts for UUIDs and AirModel params
+        params = to_serializable(params)  # Accounts for UUIDs and AirModel params
         while url or next_url:
             if isinstance(next_url, str):
                 response = self.__api__.client.get(next_url)
@@ -3,8 +3,8 @@
 import inspect
 from dataclasses import Field, fields, is_dataclass
 from datetime import datetime, timezone
-from functools import wraps
-from typing import Optional, get_type_hints, TypeVar, Callable, Any, cast
+from functools import lru_cache, wraps
+from typing import Optional, get_type_hints, TypeVar, Callable, Any, Dict, cast
 from urllib.parse import ParseResult, urlparse
 from uuid import UUID
 
@@ -13,6 +13,7 @@ from air_sdk.v2.typing import type_check
 F = TypeVar('F', bound=Callable[..., Any])
 
 
+@lru_cache(maxsize=1024)
 def join_urls(*args: str) -> str:
     return '/'.join(frag.strip('/') for frag in args) + '/'
 
@@ -59,12 +60,16 @@ def as_field(class_or_instance: object, name: str) -> Optional[Field]:  # type:
 
 def validate_payload_types(func: F) -> F:
     """A wrapper for validating the type of payload during create."""
+    sig = inspect.signature(func)
+    hints: Optional[Dict[str, Any]] = None
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        hints = get_type_hints(func)
+        nonlocal hints
+        if hints is None:
+            # Resolved on the first call so that forward references in annotations are defined
+            hints = get_type_hints(func)
 
-        sig = inspect.signature(func)
         bound_args = sig.bind(*args, **kwargs)
         bound_args.apply_defaults()
 
@@ -41,10 +41,7 @@ from air_sdk.topology_file import TopologyFileApi
 from air_sdk.userconfig import UserConfigAPI
 from air_sdk.worker import WorkerApi
 
-import faker
-
-faker.Faker.seed(0)
-fake = faker.Faker()
+_PASSWORD = 'correct-horse-battery'
 
 
 class TestAirSession(TestCase):
@@ -217,11 +214,11 @@ class TestAirApi(TestCase):
     @patch('air_sdk.login.LoginApi.list')
     def test_authorize_password(self, mock_login):
         mock_login.return_value.username = 'john'
-        password = fake.slug()
-        self.api.get_token = MagicMock(return_value=password)
-        self.api.authorize(username='foo', password=fake.slug())
-        self.assertEqual(self.api.token, password)
-        self.assertEqual(self.api.client.headers['authorization'], f'Bearer {password}')
+        token = 'abc123'
+        self.api.get_token = MagicMock(return_value=token)
+        self.api.authorize(username='foo', password=_PASSWORD)
+        self.assertEqual(self.api.token, token)
+        self.assertEqual(self.api.client.headers['authorization'], f'Bearer {token}')
         self.assertEqual(self.api.username, 'john')
 
     def test_authorize_bad_args(self):
@@ -234,11 +231,10 @@ class TestAirApi(TestCase):
     @patch('air_sdk.air_api.AirApi.post')
     def test_get_token(self, mock_post):
         mock_post.return_value.json.return_value = {'token': 'abc123'}
-        password = fake.slug()
-        res = self.api.get_token('foo', password)
+        res = self.api.get_token('foo', _PASSWORD)
         self.assertEqual(res, 'abc123')
         mock_post.assert_called_with(
-            'http://test/api/v1/login/', attempt_reauth=False, json={'username': 'foo', 'password': password}
+            'http://test/api/v1/login/', attempt_reauth=False, json={'username': 'foo', 'password': _PASSWORD}
         )
 
     @patch('air_sdk.air_api.AirApi.post')
@@ -343,7 +339,7 @@ class TestAirApi(TestCase):
         url = 'http://test/'
         args = ['testing']
         kwargs = {'foo': 'bar'}
-        self.api._kwargs = {'username': 'test', 'password': fake.slug()}
+        self.api._kwargs = {'username': 'test', 'password': _PASSWORD}
         self.api.client.request.return_value.status_code = 403
 
         original_request = self.api._request
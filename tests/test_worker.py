@@ -10,11 +10,9 @@ from http import HTTPStatus
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-import faker
 from air_sdk import fleet, organization, worker
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_PASSWORD = 'correct-horse-battery'
 
 
 class TestWorker(TestCase):
@@ -99,7 +97,6 @@ class TestWorkerApi(TestCase):
     @patch('air_sdk.util.raise_if_invalid_response')
     def test_create(self, mock_raise):
         self.client.post.return_value.json.return_value = {'id': 'abc'}
-        fake_pwd = fake.slug()
         res = self.api.create(
             fqdn='worker_test',
             cpu=1,
@@ -108,7 +105,7 @@ class TestWorkerApi(TestCase):
             ip_address='10.1.1.1',
             port_range='1-2',
             username='foo',
-            password=fake_pwd,
+            password=_PASSWORD,
             fleet=str(self.fleet.id),
             contact='contact@nvidia.com',
         )
@@ -122,7 +119,7 @@ class TestWorkerApi(TestCase):
                 'ip_address': '10.1.1.1',
                 'port_range': '1-2',
                 'username': 'foo',
-                'password': fake_pwd,
+                'password': _PASSWORD,
                 'fleet': str(self.fleet.id),
                 'contact': 'contact@nvidia.com',
             },
@@ -132,9 +129,8 @@ class TestWorkerApi(TestCase):
         self.assertEqual(res.id, 'abc')
 
     def test_create_required_kwargs(self):
-        fake_pwd = fake.slug()
         with self.assertRaises(AttributeError) as err:
-            self.api.create(cpu=1, memory=2, storage=3, port_range='1-2', username='foo', password=fake_pwd)
+            self.api.create(cpu=1, memory=2, storage=3, port_range='1-2', username='foo', password=_PASSWORD)
         self.assertTrue('requires ip_address' in str(err.exception))
         with self.assertRaises(AttributeError) as err:
             self.api.create(
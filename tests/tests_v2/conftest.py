@@ -1,9 +1,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 import json
-from datetime import timezone
+from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 import random
+import uuid
 from typing import Any, TypedDict, Optional, List, Dict
 
 import pytest
@@ -13,15 +14,61 @@ import faker
 from air_sdk import v2
 from air_sdk.v2 import AirError
 from air_sdk.v2.air_model import AirModel
-from air_sdk.v2.endpoints.mixins import serialize_payload
+from air_sdk.v2.endpoints.mixins import to_serializable
 from air_sdk.v2.utils import join_urls
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+# Choices for enumerated model fields
+_SEVERITIES = ('Alert', 'Info')
+_CPU_ARCHS = ('x86', 'ARM')
+_IMAGE_PROVIDERS = ('VM', 'CONTAINER')
+_NODE_STATES = ('RUNNING', 'PAUSED', 'SHUTOFF', 'SNAPSHOT')
+_INTERFACE_TYPES = ('ETH_INTF', 'PCIE_INTF', 'OOB_INTF')
+_JOB_CATEGORIES = ('START', 'STOP', 'EXEC', 'PURGE')
+_JOB_STATES = ('CREATED', 'QUEUED', 'WORKING', 'COMPLETE', 'FAILED', 'CANCELLED')
+_SERVICE_TYPES = ('SSH', 'HTTPS', 'HTTP')
+_SIMULATION_STATES = ('NEW', 'LOADING', 'LOADED', 'ERROR')
+_USER_CONFIG_KINDS = ('cloud-init-user-data', 'cloud-init-meta-data')
 
+# Fixed values for free-text model fields whose content no test inspects
+_LOREM = 'Lorem ipsum dolor sit amet.'
+_COMPANY = 'Acme Corp'
+_DEMO_TAGS = ('tag-a', 'tag-b', 'tag-c')
+_SIMULATION_METADATA = json.dumps({'key': 'value'})
 
-@pytest.fixture
+
+# Shared generator for plain random values; cheaper than going through Faker providers.
+_rng = random.Random(0)
+
+_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+_EPOCH_SPAN_SECONDS = 5 * 365 * 24 * 60 * 60
+
+
+def _ordered_datetimes(count: int = 2) -> List[datetime]:
+    """Return `count` random UTC datetimes in ascending order (e.g. `created` before `modified`)."""
+    return sorted(_EPOCH + timedelta(seconds=_rng.random() * _EPOCH_SPAN_SECONDS) for _ in range(count))
+
+
+def _random_flags(count: int) -> List[bool]:
+    """Return `count` random booleans drawn from a single call to the generator."""
+    bits = _rng.getrandbits(count)
+    return [bool(bits >> i & 1) for i in range(count)]
+
+
+def _uuid_str() -> str:
+    """Return a random UUID in its canonical (hyphenated) string form."""
+    return str(uuid.uuid4())
+
+
+@pytest.fixture(scope='session')
+def fake():
+    """A seeded `Faker` instance shared by the whole test session."""
+    faker.Faker.seed(0)
+    return faker.Faker()
+
+
+@pytest.fixture(scope='session')
 def api():
+    """An unauthenticated API shared by all tests; tests must not modify its client's state."""
     return v2.AirApi(api_url='https://air-fake-test.nvidia.com/api/', authenticate=False)
 
 
@@ -44,8 +91,9 @@ class PaginatedResponse(TypedDict):
     status_code: int
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def paginated_response() -> PaginatedResponse:
+    """An empty paginated response shared by all tests; it must not be mutated."""
     return {'json': {'next': None, 'previous': None, 'count': 0, 'results': []}, 'status_code': HTTPStatus.OK}
 
 
@@ -65,61 +113,86 @@ def setup_mock_responses(mock_client):
     return _setup_mock_responses
 
 
+@pytest.fixture
+def resolve_placeholders():
+    """Replace placeholder values of a payload, e.g. `'use_simulation'`, with the values they stand for.
+
+    Placeholders map to callables building the value, so model instances are only created for the
+    cases using them. Placeholders inside a list are resolved item by item.
+    """
+
+    def _resolve(value, placeholders):
+        if isinstance(value, list):
+            return [_resolve(item, placeholders) for item in value]
+        if isinstance(value, str) and value in placeholders:
+            return placeholders[value]()
+        return value
+
+    def _resolve_placeholders(payload, placeholders):
+        return {key: _resolve(value, placeholders) for key, value in payload.items()}
+
+    return _resolve_placeholders
+
+
 # FACTORY CLASSES
 
 
 @pytest.fixture
 def account_factory():
     def _account_factory(api, **kwargs: Any):
-        defaults = {'id': fake.uuid4(cast_to=str)}
-        return api.accounts.load_model({**defaults, **kwargs})
+        defaults = {'id': _uuid_str()}
+        defaults.update(kwargs)
+        return api.accounts.load_model(defaults)
 
     return _account_factory
 
 
 @pytest.fixture
-def api_token_factory():
+def api_token_factory(fake):
     def _api_token_factory(api, **kwargs: Any):
-        expiry = fake.date_time(tzinfo=timezone.utc)
+        created, expiry = _ordered_datetimes()
         defaults = {
-            'id': fake.uuid4(cast_to=str),
+            'id': _uuid_str(),
             'name': fake.slug(),
-            'created': fake.date_time(end_datetime=expiry, tzinfo=timezone.utc),
+            'created': created,
             'expiry': expiry,
         }
-        return api.api_tokens.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.api_tokens.load_model(defaults)
 
     return _api_token_factory
 
 
 @pytest.fixture
-def announcement_factory():
+def announcement_factory(fake):
     def _announcement_factory(api, **kwargs: Any):
-        modified = fake.date_time(tzinfo=timezone.utc)
+        created, modified = _ordered_datetimes()
         defaults = {
-            'id': fake.uuid4(cast_to=str),
-            'severity': random.choice(('Alert', 'Info')),
-            'created': fake.date_time(end_datetime=modified, tzinfo=timezone.utc),
+            'id': _uuid_str(),
+            'severity': _rng.choice(_SEVERITIES),
+            'created': created,
             'modified': modified,
-            'message': fake.text(),
+            'message': _LOREM,
         }
-        return api.announcements.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.announcements.load_model(defaults)
 
     return _announcement_factory
 
 
 @pytest.fixture
-def image_factory():
+def image_factory(fake):
     def _image_factory(api, **kwargs: Any):
-        modified = fake.date_time(tzinfo=timezone.utc)
+        created, modified = _ordered_datetimes()
+        agent_enabled, archived, published, can_edit = _random_flags(4)
         defaults = {
-            'id': fake.uuid4(cast_to=str),
-            'agent_enabled': fake.pybool(),
-            'archived': fake.pybool(),
+            'id': _uuid_str(),
+            'agent_enabled': agent_enabled,
+            'archived': archived,
             'bios': None,
             'bus': 'virtio',
-            'cpu_arch': random.choice(('x86', 'ARM')),
-            'created': fake.date_time(end_datetime=modified, tzinfo=timezone.utc),
+            'cpu_arch': _rng.choice(_CPU_ARCHS),
+            'created': created,
             'default_username': fake.slug(),
             'default_password': fake.slug(),
             'features': {},
@@ -127,113 +200,119 @@ def image_factory():
             'mountpoint': '',
             'console_support': {'serial': False, 'visual': False, 'default': None},
             'minimum_resources': {'cpu': 1, 'memory': 1024, 'storage': 10},
-            'name': fake.company(),
-            'notes': fake.text(max_nb_chars=64),
-            'organization': fake.uuid4(cast_to=str),
-            'published': fake.pybool(),
-            'provider': random.choice(('VM', 'CONTAINER')),
-            'release_notes': fake.text(max_nb_chars=64),
+            'name': _COMPANY,
+            'notes': _LOREM,
+            'organization': _uuid_str(),
+            'published': published,
+            'provider': _rng.choice(_IMAGE_PROVIDERS),
+            'release_notes': _LOREM,
             'simx': None,
-            'size': fake.pyint(10000, 20000),
+            'size': _rng.randint(10000, 20000),
             'upload_status': 'COMPLETE',
-            'uploader': fake.uuid4(cast_to=str),
+            'uploader': _uuid_str(),
             'user_manual': fake.url(),
             'version': fake.slug(),
-            'can_edit': fake.pybool(),
-            'organization_name': fake.company(),
+            'can_edit': can_edit,
+            'organization_name': _COMPANY,
             'uploader_username': fake.email(domain='nvidia.com'),
         }
-        return api.images.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.images.load_model(defaults)
 
     return _image_factory
 
 
 @pytest.fixture
-def node_factory():
+def node_factory(fake):
     def _node_factory(api, **kwargs: Any):
-        modified = fake.date_time(tzinfo=timezone.utc)
+        created, modified = _ordered_datetimes()
         defaults = {
-            'id': fake.uuid4(cast_to=str),
+            'id': _uuid_str(),
             'name': fake.slug(),
-            'created': fake.date_time(end_datetime=modified, tzinfo=timezone.utc),
+            'created': created,
             'modified': modified,
-            'simulation': fake.uuid4(cast_to=str),
-            'os': fake.uuid4(cast_to=str),
-            'console_port': fake.port_number(),
-            'serial_port': fake.port_number(),
-            'state': random.choice(('RUNNING', 'PAUSED', 'SHUTOFF', 'SNAPSHOT')),
-            'memory': fake.pyint(1024, 2048),
-            'storage': fake.pyint(8, 16),
-            'cpu': fake.pyint(1, 4),
+            'simulation': _uuid_str(),
+            'os': _uuid_str(),
+            'console_port': _rng.randint(1, 65535),
+            'serial_port': _rng.randint(1, 65535),
+            'state': _rng.choice(_NODE_STATES),
+            'memory': _rng.randint(1024, 2048),
+            'storage': _rng.randint(8, 16),
+            'cpu': _rng.randint(1, 4),
             'version': 3,
             'features': '{}',
-            'boot_group': fake.pyint(10, 100),
-            'pos_x': fake.pyfloat(min_value=-10, max_value=10),
-            'pos_y': fake.pyfloat(min_value=-10, max_value=10),
+            'boot_group': _rng.randint(10, 100),
+            'pos_x': _rng.uniform(-10, 10),
+            'pos_y': _rng.uniform(-10, 10),
         }
-        for key, value in list(kwargs.items()):
-            if key in ('cpu', 'memory', 'storage') and value is None:
+        for key in ('cpu', 'memory', 'storage'):
+            if key in kwargs and kwargs[key] is None:
                 del kwargs[key]  # These will be populated with defaults by the BE
-        return api.nodes.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.nodes.load_model(defaults)
 
     return _node_factory
 
 
 @pytest.fixture
-def cloud_init_factory():
+def cloud_init_factory(fake):
     def _cloud_init_factory(api, **kwargs: Any):
         defaults = {
-            'simulation_node': fake.uuid4(),
-            'user_data': fake.uuid4(),
-            'meta_data': fake.uuid4(),
+            'simulation_node': _uuid_str(),
+            'user_data': _uuid_str(),
+            'meta_data': _uuid_str(),
             'user_data_name': fake.slug(),
             'meta_data_name': fake.slug(),
         }
-        return api.cloud_inits.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.cloud_inits.load_model(defaults)
 
     return _cloud_init_factory
 
 
 @pytest.fixture
-def interface_factory():
+def interface_factory(fake):
     def _interface_factory(api, **kwargs: Any):
+        link_up, preserve_mac, outbound = _random_flags(3)
         defaults = {
-            'id': fake.uuid4(cast_to=str),
+            'id': _uuid_str(),
             'name': fake.slug(),
-            'link_up': fake.pybool(),
+            'link_up': link_up,
             'internal_ipv4': fake.ipv4(),
             'full_ipv6': fake.ipv6(),
             'prefix_ipv6': fake.ipv6(),
-            'interface_type': random.choice(('ETH_INTF', 'PCIE_INTF', 'OOB_INTF')),
-            'port_number': fake.port_number(),
-            'preserve_mac': fake.pybool(),
-            'outbound': fake.pybool(),
+            'interface_type': _rng.choice(_INTERFACE_TYPES),
+            'port_number': _rng.randint(1, 65535),
+            'preserve_mac': preserve_mac,
+            'outbound': outbound,
             'mac_address': fake.mac_address(),
-            'node': fake.uuid4(cast_to=str),
-            'simulation': fake.uuid4(cast_to=str),
+            'node': _uuid_str(),
+            'simulation': _uuid_str(),
             'link': None,
         }
-        return api.interfaces.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.interfaces.load_model(defaults)
 
     return _interface_factory
 
 
 @pytest.fixture
-def job_factory():
+def job_factory(fake):
     def _job_factory(api, **kwargs):
-        last_updated = fake.date_time(tzinfo=timezone.utc)
+        created, last_updated = _ordered_datetimes()
         defaults = {
-            'id': fake.uuid4(cast_to=str),
-            'category': random.choice(('START', 'STOP', 'EXEC', 'PURGE')),
-            'state': random.choice(('CREATED', 'QUEUED', 'WORKING', 'COMPLETE', 'FAILED', 'CANCELLED')),
-            'created': fake.date_time(end_datetime=last_updated, tzinfo=timezone.utc),
+            'id': _uuid_str(),
+            'category': _rng.choice(_JOB_CATEGORIES),
+            'state': _rng.choice(_JOB_STATES),
+            'created': created,
             'last_updated': last_updated,
-            'notes': fake.text(),
-            'data': fake.text(),
-            'simulation': fake.uuid4(cast_to=str),
-            'worker': fake.uuid4(cast_to=str),
+            'notes': _LOREM,
+            'data': _LOREM,
+            'simulation': _uuid_str(),
+            'worker': _uuid_str(),
         }
-        return api.jobs.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.jobs.load_model(defaults)
 
     return _job_factory
 
@@ -242,139 +321,148 @@ def job_factory():
 def link_factory():
     def _link_factory(api, **kwargs):
         defaults = {
-            'id': fake.uuid4(cast_to=str),
-            'simulation_interfaces': [fake.uuid4(cast_to=str), fake.uuid4(cast_to=str)],
+            'id': _uuid_str(),
+            'simulation_interfaces': [_uuid_str(), _uuid_str()],
         }
-        return api.links.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.links.load_model(defaults)
 
     return _link_factory
 
 
 @pytest.fixture
-def marketplace_demo_factory():
+def marketplace_demo_factory(fake):
     """A factory fixture for generating valid marketplace demos."""
 
     def _marketplace_demo_factory(api, **kwargs: Any):
         """A factory class for generating MarketplaceDemos."""
-        modified = fake.date_time(tzinfo=timezone.utc)
+        created, modified = _ordered_datetimes()
+        liked_by_account, published = _random_flags(2)
         defaults = {
             'modified': modified,
-            'created': fake.date_time(end_datetime=modified, tzinfo=timezone.utc),
-            'description': fake.text(),
+            'created': created,
+            'description': _LOREM,
             'documentation': fake.url(),
-            'documentation_details': fake.text(),
+            'documentation_details': _LOREM,
             'icon': fake.slug(),
-            'id': fake.uuid4(cast_to=str),
-            'liked_by_account': fake.pybool(),
-            'like_count': fake.pyint(),
-            'name': fake.company(),
+            'id': _uuid_str(),
+            'liked_by_account': liked_by_account,
+            'like_count': _rng.randint(0, 9999),
+            'name': _COMPANY,
             'owner_email': (
                 fake.slug()  # To prevent real emails
                 + fake.email(domain='nvidia.com')
             ),
-            'published': fake.pybool(),
+            'published': published,
             'repo': fake.url(),
-            'snapshot': fake.uuid4(cast_to=str),
-            'tags': fake.pylist(value_types=(str,)),
+            'snapshot': _uuid_str(),
+            'tags': list(_DEMO_TAGS),
         }
-        return api.marketplace_demos.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.marketplace_demos.load_model(defaults)
 
     return _marketplace_demo_factory
 
 
 @pytest.fixture
-def marketplace_demo_tag_factory():
+def marketplace_demo_tag_factory(fake):
     """A factory fixture for generating valid marketplace demo tags."""
 
     def _marketplace_demo_tag_factory(api, **kwargs: Any):
         """A factory class for generating MarketplaceDemos."""
         defaults = {'name': fake.slug()}
-        return api.marketplace_demo_tags.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.marketplace_demo_tags.load_model(defaults)
 
     return _marketplace_demo_tag_factory
 
 
 @pytest.fixture
-def resource_budget_factory():
+def resource_budget_factory(fake):
     def _resource_budget_factory(api, **kwargs: Any):
         defaults = {
-            'id': fake.uuid4(cast_to=str),
-            'cpu': fake.pyint(),
+            'id': _uuid_str(),
+            'cpu': _rng.randint(0, 9999),
             'cpu_used': 0,
-            'image_uploads': fake.pyint(),
+            'image_uploads': _rng.randint(0, 9999),
             'image_uploads_used': 0,
-            'memory': fake.pyint(),
+            'memory': _rng.randint(0, 9999),
             'memory_used': 0,
-            'simulations': fake.pyint(),
+            'simulations': _rng.randint(0, 9999),
             'simulations_used': 0,
-            'storage': fake.pyint(),
+            'storage': _rng.randint(0, 9999),
             'storage_used': 0,
-            'userconfigs': fake.pyint(),
+            'userconfigs': _rng.randint(0, 9999),
             'userconfigs_used': 0,
         }
-        return api.resource_budgets.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.resource_budgets.load_model(defaults)
 
     return _resource_budget_factory
 
 
 @pytest.fixture
-def organization_factory(resource_budget_factory):
+def organization_factory(fake, resource_budget_factory):
     def _organization_factory(api, **kwargs: Any):
         defaults = {
-            'id': fake.uuid4(cast_to=str),
-            'name': fake.company(),
-            'member_count': fake.pyint(),
+            'id': _uuid_str(),
+            'name': _COMPANY,
+            'member_count': _rng.randint(0, 9999),
             'resource_budget': resource_budget_factory(api),
         }
-        return api.organizations.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.organizations.load_model(defaults)
 
     return _organization_factory
 
 
 @pytest.fixture
-def service_factory():
+def service_factory(fake):
     def _service_factory(api, **kwargs: Any):
-        modified = fake.date_time(tzinfo=timezone.utc)
+        created, modified = _ordered_datetimes()
         defaults = {
-            'id': fake.uuid4(cast_to=str),
+            'id': _uuid_str(),
             'name': fake.slug(),
-            'created': fake.date_time(end_datetime=modified, tzinfo=timezone.utc),
+            'created': created,
             'modified': modified,
-            'src_port': fake.port_number(),
-            'dest_port': fake.port_number(),
-            'interface': fake.uuid4(cast_to=str),
-            'simulation': fake.uuid4(cast_to=str),
-            'service_type': random.choice(('SSH', 'HTTPS', 'HTTP')),
+            'src_port': _rng.randint(1, 65535),
+            'dest_port': _rng.randint(1, 65535),
+            'interface': _uuid_str(),
+            'simulation': _uuid_str(),
+            'service_type': _rng.choice(_SERVICE_TYPES),
             'host': fake.domain_name(),
         }
-        return api.services.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.services.load_model(defaults)
 
     return _service_factory
 
 
 @pytest.fixture
-def simulation_factory():
+def simulation_factory(fake):
     def _simulation_factory(api, **kwargs: Any):
-        expires_at = sleep_at = fake.date_time(tzinfo=timezone.utc)
-        modified = fake.date_time(end_datetime=expires_at, tzinfo=timezone.utc)
+        created, modified, expires_at = _ordered_datetimes(3)
+        sleep_at = expires_at
+        (write_ok,) = _random_flags(1)
         defaults = {
-            'id': fake.uuid4(cast_to=str),
+            'id': _uuid_str(),
             'title': fake.slug(),
-            'state': random.choice(('NEW', 'LOADING', 'LOADED', 'ERROR')),
+            'state': _rng.choice(_SIMULATION_STATES),
             'sleep': True,
             'owner': fake.email(),
             'cloned': False,
             'expires': True,
             'modified': modified,
-            'created': fake.date_time(end_datetime=modified, tzinfo=timezone.utc),
+            'created': created,
             'sleep_at': sleep_at,
             'expires_at': expires_at,
-            'organization': fake.uuid4(cast_to=str),
+            'organization': _uuid_str(),
             'documentation': fake.url(),
-            'write_ok': fake.pybool(),
-            'metadata': json.dumps(fake.pydict(value_types=[str])),
+            'write_ok': write_ok,
+            'metadata': _SIMULATION_METADATA,
         }
-        return api.simulations.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.simulations.load_model(defaults)
 
     return _simulation_factory
 
@@ -382,55 +470,58 @@ def simulation_factory():
 @pytest.fixture
 def system_factory():
     def _system_factory(api, **kwargs: Any):
-        defaults = {'id': fake.uuid4(cast_to=str)}
-        return api.systems.load_model({**defaults, **kwargs})
+        defaults = {'id': _uuid_str()}
+        defaults.update(kwargs)
+        return api.systems.load_model(defaults)
 
     return _system_factory
 
 
 @pytest.fixture
-def user_config_factory():
+def user_config_factory(fake):
     def _user_config_factory(api, **kwargs: Any):
         defaults = {
-            'id': fake.uuid4(cast_to=str),
+            'id': _uuid_str(),
             'name': fake.slug(),
-            'owner': fake.uuid4(cast_to=str),  # An account
-            'owner_budget': fake.uuid4(cast_to=str),
-            'kind': random.choice(('cloud-init-user-data', 'cloud-init-meta-data')),
-            'organization': fake.uuid4(cast_to=str),
-            'organization_budget': fake.uuid4(cast_to=str),
-            'content': fake.text(),
+            'owner': _uuid_str(),  # An account
+            'owner_budget': _uuid_str(),
+            'kind': _rng.choice(_USER_CONFIG_KINDS),
+            'organization': _uuid_str(),
+            'organization_budget': _uuid_str(),
+            'content': _LOREM,
         }
-        return api.user_configs.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.user_configs.load_model(defaults)
 
     return _user_config_factory
 
 
 @pytest.fixture
-def worker_factory():
+def worker_factory(fake):
     def _worker_factory(api, **kwargs: Any):
-        modified = fake.date_time(tzinfo=timezone.utc)
+        created, modified = _ordered_datetimes()
         defaults = {
-            'id': fake.uuid4(cast_to=str),
-            'created': fake.date_time(end_datetime=modified, tzinfo=timezone.utc),
+            'id': _uuid_str(),
+            'created': created,
             'modified': modified,
             'available': True,
             'capabilities': '["general"]',
-            'cpu': fake.pyint(),
-            'cpu_arch': random.choice(('x86', 'ARM')),
+            'cpu': _rng.randint(0, 9999),
+            'cpu_arch': _rng.choice(_CPU_ARCHS),
             'contact': fake.email(),
-            'fleet': fake.uuid4(cast_to=str),
+            'fleet': _uuid_str(),
             'fqdn': fake.domain_name(),
-            'gpu': fake.pyint(),
+            'gpu': _rng.randint(0, 9999),
             'ip_address': fake.ipv4(),
-            'memory': fake.pyint(),
+            'memory': _rng.randint(0, 9999),
             'port_range': '10000-30000',
             'registered': True,
-            'storage': fake.pyint(),
-            'tunnel_port': fake.port_number(),
-            'vgpu': fake.pyint(),
+            'storage': _rng.randint(0, 9999),
+            'tunnel_port': _rng.randint(1, 65535),
+            'vgpu': _rng.randint(0, 9999),
         }
-        return api.workers.load_model({**defaults, **kwargs})
+        defaults.update(kwargs)
+        return api.workers.load_model(defaults)
 
     return _worker_factory
 
@@ -442,12 +533,11 @@ def worker_factory():
 def run_list_test(setup_mock_responses):
     """A pytest fixture for running a common test on the `list` method of an api."""
 
-    def _run_list_test(endpoint_api, model_factory):
-        # Set up mock client
-        results = [
-            json.loads(model_factory(endpoint_api.__api__).json()),
-            json.loads(model_factory(endpoint_api.__api__).json()),
-        ]
+    def _run_list_test(endpoint_api, model_factory, **params):
+        # Set up mock client; rows only need distinct primary keys, so serialize a single instance
+        instance = model_factory(endpoint_api.__api__)
+        result = to_serializable(instance.dict())
+        results = [result, {**result, instance.primary_key_field: _uuid_str()}]
         setup_mock_responses(
             {
                 ('GET', endpoint_api.url): {
@@ -457,7 +547,7 @@ def run_list_test(setup_mock_responses):
             }
         )
         # Test SDK
-        instances = list(endpoint_api.list(limit=len(results)))
+        instances = list(endpoint_api.list(**params, limit=len(results)))
         assert len(instances) == len(results)
         assert isinstance(instances[0], endpoint_api.model)
         return instances
@@ -469,11 +559,10 @@ def run_list_test(setup_mock_responses):
 def run_refresh_test(setup_mock_responses):
     def _run_refresh_test(endpoint_api, model_factory):
         instance = model_factory(endpoint_api.__api__)
-        model_data = json.loads(instance.json())
         setup_mock_responses(
             {
                 ('GET', join_urls(endpoint_api.url, str(instance.__pk__))): {
-                    'json': model_data,
+                    'json': to_serializable(instance.dict()),
                     'status_code': HTTPStatus.OK,
                 }
             }
@@ -492,7 +581,7 @@ def run_delete_test(setup_mock_responses):
         instance = model_factory(endpoint_api.__api__)
         assert instance.__pk__ is not None, 'The instance must have a populated primary key.'
         # Set up mock client
-        url = join_urls(endpoint_api.url, instance.__pk__)
+        url = join_urls(endpoint_api.url, str(instance.__pk__))
         setup_mock_responses({('DELETE', url): {'status_code': HTTPStatus.NO_CONTENT}})
         # Call delete
         assert instance.delete() is None
@@ -509,12 +598,12 @@ def run_create_test_case(setup_mock_responses):
 
     def _run_test_case(endpoint_api, model_factory, payload, is_valid):
         if is_valid:
-            processed_payload = json.loads(serialize_payload(payload))
+            processed_payload = to_serializable(payload)
             expected_inst = model_factory(endpoint_api.__api__, **processed_payload)
             setup_mock_responses(
                 {
                     ('POST', endpoint_api.url): {
-                        'json': json.loads(expected_inst.json()),
+                        'json': to_serializable(expected_inst.dict()),
                         'status_code': HTTPStatus.CREATED,
                     }
                 }
@@ -535,15 +624,15 @@ def run_update_patch_test(setup_mock_responses):
     def _run_test_case(endpoint_api, model_factory, payload, is_valid):
         instance = model_factory(endpoint_api.__api__)
         if is_valid:
-            processed_payload = json.loads(
-                serialize_payload({k: v for k, v in payload.items() if v is not None})
-            )
-            updated_inst = model_factory(endpoint_api.__api__, **{**instance.dict(), **processed_payload})
+            processed_payload = to_serializable({k: v for k, v in payload.items() if v is not None})
+            updated_fields = instance.dict()
+            updated_fields.update(processed_payload)
+            updated_inst = model_factory(endpoint_api.__api__, **updated_fields)
             detail_url = join_urls(endpoint_api.url, str(instance.__pk__))
             setup_mock_responses(
                 {
                     ('PATCH', detail_url): {
-                        'json': json.loads(instance.json()),
+                        'json': to_serializable(instance.dict()),
                         'status_code': HTTPStatus.OK,
                     },
                 }
@@ -564,13 +653,15 @@ def run_full_update_patch_test(setup_mock_responses):
     def _run_test_case(endpoint_api, model_factory, payload, is_valid):
         instance = model_factory(endpoint_api.__api__)
         if is_valid:
-            processed_payload = json.loads(serialize_payload(payload))
-            updated_inst = model_factory(endpoint_api.__api__, **{**instance.dict(), **processed_payload})
+            processed_payload = to_serializable(payload)
+            updated_fields = instance.dict()
+            updated_fields.update(processed_payload)
+            updated_inst = model_factory(endpoint_api.__api__, **updated_fields)
             detail_url = join_urls(endpoint_api.url, str(instance.__pk__))
             setup_mock_responses(
                 {
                     ('PATCH', detail_url): {
-                        'json': json.loads(instance.json()),
+                        'json': to_serializable(instance.dict()),
                         'status_code': HTTPStatus.OK,
                     },
                 }
@@ -591,13 +682,15 @@ def run_full_update_put_test(setup_mock_responses):
     def _run_test_case(endpoint_api, model_factory, payload, is_valid):
         instance = model_factory(endpoint_api.__api__)
         if is_valid:
-            processed_payload = json.loads(serialize_payload(payload))
-            updated_inst = model_factory(endpoint_api.__api__, **{**instance.dict(), **processed_payload})
+            processed_payload = to_serializable(payload)
+            updated_fields = instance.dict()
+            updated_fields.update(processed_payload)
+            updated_inst = model_factory(endpoint_api.__api__, **updated_fields)
             detail_url = join_urls(endpoint_api.url, str(instance.__pk__))
             setup_mock_responses(
                 {
                     ('PUT', detail_url): {
-                        'json': json.loads(instance.json()),
+                        'json': to_serializable(instance.dict()),
                         'status_code': HTTPStatus.OK,
                     },
                 }
@@ -1,12 +1,8 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
-import faker
 import pytest
 
-faker.Faker.seed(0)
-fake = faker.Faker()
-
 
 class TestAnnouncementEndpointApi:
     def test_list(self, api, run_list_test, announcement_factory):
@@ -21,10 +17,10 @@ class TestAnnouncementEndpointApi:
             ({}, False),
             ({'severity': None}, False),
             ({'severity': None, 'message': None}, False),
-            ({'severity': fake.slug()}, False),
-            ({'severity': fake.slug(), 'message': None}, False),
-            ({'severity': fake.slug(), 'message': fake.text()}, True),
-            ({'severity': None, 'message': fake.text()}, False),
+            ({'severity': 'some-severity'}, False),
+            ({'severity': 'some-severity', 'message': None}, False),
+            ({'severity': 'some-severity', 'message': 'hello world'}, True),
+            ({'severity': None, 'message': 'hello world'}, False),
         ),
     )
     def test_create(self, api, announcement_factory, run_create_test_case, payload, is_valid):
@@ -1,11 +1,9 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
-import faker
-import pytest
+from datetime import datetime
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+import pytest
 
 
 class TestApiTokenEndpointApi:
@@ -20,11 +18,11 @@ class TestApiTokenEndpointApi:
         (
             ({'name': None}, False),
             ({}, False),
-            ({'random_key': fake.slug()}, False),
-            ({'name': fake.slug()}, True),
-            ({'name': fake.slug(), 'random_key': None}, False),
-            ({'name': fake.slug(), 'expiry': None}, True),
-            ({'name': fake.slug(), 'expiry': fake.date_time()}, True),
+            ({'random_key': 'some-value'}, False),
+            ({'name': 'token-name'}, True),
+            ({'name': 'token-name', 'random_key': None}, False),
+            ({'name': 'token-name', 'expiry': None}, True),
+            ({'name': 'token-name', 'expiry': datetime(2030, 1, 1)}, True),
         ),
     )
     def test_create(self, api, api_token_factory, run_create_test_case, payload, is_valid):
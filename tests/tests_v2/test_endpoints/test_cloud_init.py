@@ -1,15 +1,14 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
-import json
 from http import HTTPStatus
+from uuid import UUID
 
 import pytest
-import faker
 
-from air_sdk.v2.endpoints.mixins import serialize_payload
+from air_sdk.v2.endpoints.mixins import to_serializable
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_USER_DATA_ID = UUID('3f1c9a52-6d0e-4b7a-9c2e-5a8d1f4e7b60')
+_META_DATA_ID = UUID('a7e2d4c8-1b9f-4e3a-8d6c-2f5b0e9a1c37')
 
 
 class TestCloudInitEndpointApi:
@@ -19,15 +18,15 @@ class TestCloudInitEndpointApi:
             # Empty case
             ({}, False),
             ({'user_data': None, 'meta_data': None}, True),
-            ({'user_data': fake.pybool(), 'meta_data': None}, False),
-            ({'user_data': fake.uuid4(cast_to=None), 'meta_data': fake.uuid4(cast_to=None)}, True),
-            ({'user_data': fake.uuid4(cast_to=None), 'meta_data': None}, True),
-            ({'user_data': None, 'meta_data': fake.uuid4(cast_to=None)}, True),
+            ({'user_data': True, 'meta_data': None}, False),
+            ({'user_data': _USER_DATA_ID, 'meta_data': _META_DATA_ID}, True),
+            ({'user_data': _USER_DATA_ID, 'meta_data': None}, True),
+            ({'user_data': None, 'meta_data': _META_DATA_ID}, True),
             (
                 {
-                    'user_data': fake.uuid4(cast_to=None),
-                    'meta_data': fake.uuid4(cast_to=None),
-                    'unexpected_field': fake.uuid4(cast_to=None),
+                    'user_data': _USER_DATA_ID,
+                    'meta_data': _META_DATA_ID,
+                    'unexpected_field': _USER_DATA_ID,
                 },
                 False,
             ),
@@ -39,15 +38,15 @@ class TestCloudInitEndpointApi:
         endpoint_api = api.cloud_inits
         instance = cloud_init_factory(endpoint_api.__api__)
         if is_valid:
-            processed_payload = json.loads(serialize_payload(payload))
-            updated_inst = cloud_init_factory(
-                endpoint_api.__api__, **{**instance.dict(), **processed_payload}
-            )
+            processed_payload = to_serializable(payload)
+            updated_fields = instance.dict()
+            updated_fields.update(processed_payload)
+            updated_inst = cloud_init_factory(endpoint_api.__api__, **updated_fields)
             detail_url = endpoint_api.url.format(id=str(instance.__pk__))
             setup_mock_responses(
                 {
                     ('PATCH', detail_url): {
-                        'json': json.loads(instance.json()),
+                        'json': to_serializable(instance.dict()),
                         'status_code': HTTPStatus.OK,
                     },
                 }
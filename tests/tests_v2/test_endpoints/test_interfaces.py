@@ -1,13 +1,14 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
-import json
 from http import HTTPStatus
+from uuid import UUID, uuid4
 
 import pytest
-import faker
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+from air_sdk.v2.endpoints.mixins import to_serializable
+
+_NODE_ID = '5d3c1e8a-2f4b-4c6d-9e7f-0a1b2c3d4e5f'
+_LINK_ID = '8b7a6c5d-4e3f-4a2b-8c1d-0e9f8a7b6c5d'
 
 
 class TestInterfaceEndpointApi:
@@ -15,9 +16,9 @@ class TestInterfaceEndpointApi:
         run_list_test(api.interfaces, interface_factory)
 
     def test_link_lazy_attribute(self, setup_mock_responses, api, interface_factory, link_factory):
-        link_uuid = str(fake.uuid4())
+        link_uuid = str(uuid4())
         interface = interface_factory(api, link=link_uuid)
-        results = [json.loads(link_factory(api, id=link_uuid).json())]
+        results = [to_serializable(link_factory(api, id=link_uuid).dict())]
         setup_mock_responses(
             {
                 ('GET', api.links.url): {
@@ -39,32 +40,32 @@ class TestInterfaceEndpointApi:
         (
             ({}, False),
             ({'name': None, 'node': None}, False),
-            ({'name': fake.slug(), 'node': None}, False),
-            ({'name': None, 'node': fake.uuid4(cast_to=str)}, False),
-            ({'name': fake.slug(), 'node': fake.uuid4(cast_to=str)}, True),
-            ({'name': fake.slug(), 'node': fake.uuid4(cast_to=str), 'interface_type': None}, False),
-            ({'name': fake.slug(), 'node': fake.uuid4(cast_to=str), 'interface_type': 'OOB_INTF'}, True),
+            ({'name': 'eth0', 'node': None}, False),
+            ({'name': None, 'node': _NODE_ID}, False),
+            ({'name': 'eth0', 'node': _NODE_ID}, True),
+            ({'name': 'eth0', 'node': _NODE_ID, 'interface_type': None}, False),
+            ({'name': 'eth0', 'node': _NODE_ID, 'interface_type': 'OOB_INTF'}, True),
             (
                 {
-                    'name': fake.slug(),
-                    'node': fake.uuid4(cast_to=str),
-                    'link_up': fake.pybool(),
-                    'port_number': fake.port_number(),
-                    'outbound': fake.pybool(),
-                    'preserve_mac': fake.pybool(),
-                    'mac_address': fake.mac_address(),
-                    'internal_ipv4': fake.ipv4(),
-                    'full_ipv6': fake.ipv6(),
-                    'prefix_ipv6': fake.ipv6(),
-                    'link': fake.uuid4(cast_to=str),
+                    'name': 'eth0',
+                    'node': _NODE_ID,
+                    'link_up': True,
+                    'port_number': 22,
+                    'outbound': False,
+                    'preserve_mac': True,
+                    'mac_address': '00:00:5e:00:53:01',
+                    'internal_ipv4': '192.0.2.1',
+                    'full_ipv6': '2001:db8::1',
+                    'prefix_ipv6': '2001:db8::',
+                    'link': _LINK_ID,
                 },
                 True,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'node': fake.uuid4(cast_to=str),
-                    'link': fake.pybool(),
+                    'name': 'eth0',
+                    'node': _NODE_ID,
+                    'link': True,
                 },
                 False,
             ),
@@ -79,7 +80,7 @@ class TestInterfaceEndpointApi:
             setup_mock_responses(
                 {
                     ('POST', endpoint_api.url): {
-                        'json': json.loads(expected_inst.json()),
+                        'json': to_serializable(expected_inst.dict()),
                         'status_code': HTTPStatus.CREATED,
                     }
                 }
@@ -98,13 +99,13 @@ class TestInterfaceEndpointApi:
             # Empty case
             ({}, True),
             # Valid data cases
-            ({'name': fake.slug()}, True),
-            ({'port_number': fake.port_number()}, True),
-            ({'outbound': fake.pybool()}, True),
-            ({'link_up': fake.pybool()}, True),
-            ({'preserve_mac': fake.pybool()}, True),
-            ({'link': fake.uuid4(cast_to=None)}, True),
-            ({'link': fake.uuid4(cast_to=str)}, True),
+            ({'name': 'eth0'}, True),
+            ({'port_number': 22}, True),
+            ({'outbound': False}, True),
+            ({'link_up': True}, True),
+            ({'preserve_mac': False}, True),
+            ({'link': UUID(_LINK_ID)}, True),
+            ({'link': _LINK_ID}, True),
             ({'link': 'use_real_link'}, True),
             # None cases
             ({'name': None}, True),
@@ -114,17 +115,25 @@ class TestInterfaceEndpointApi:
             ({'preserve_mac': None}, True),
             ({'link': None}, True),
             # Invalid data type cases
-            ({'name': fake.pyint()}, False),
-            ({'port_number': fake.slug()}, False),
-            ({'outbound': fake.slug()}, False),
-            ({'link_up': fake.slug}, False),
-            ({'preserve_mac': fake.slug()}, False),
-            ({'link': fake.pyint()}, False),
+            ({'name': 42}, False),
+            ({'port_number': 'not-a-port'}, False),
+            ({'outbound': 'not-a-bool'}, False),
+            ({'link_up': 'not-a-bool'}, False),
+            ({'preserve_mac': 'not-a-bool'}, False),
+            ({'link': 42}, False),
         ),
     )
-    def test_update(self, api, run_update_patch_test, interface_factory, link_factory, payload, is_valid):
-        if payload.get('link') == 'use_real_link':
-            payload['link'] = link_factory(api)
+    def test_update(
+        self,
+        api,
+        run_update_patch_test,
+        resolve_placeholders,
+        interface_factory,
+        link_factory,
+        payload,
+        is_valid,
+    ):
+        payload = resolve_placeholders(payload, {'use_real_link': lambda: link_factory(api)})
         run_update_patch_test(api.interfaces, interface_factory, payload, is_valid)
 
     @pytest.mark.parametrize(
@@ -134,74 +143,80 @@ class TestInterfaceEndpointApi:
             ({}, False),
             (
                 {
-                    'name': fake.slug(),
-                    'port_number': fake.port_number(),
-                    'outbound': fake.pybool(),
-                    'preserve_mac': fake.pybool(),
-                    'link_up': fake.pybool(),
+                    'name': 'eth0',
+                    'port_number': 22,
+                    'outbound': True,
+                    'preserve_mac': False,
+                    'link_up': True,
                     'link': 'use_real_link',
                 },
                 True,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'port_number': fake.port_number(),
-                    'outbound': fake.pybool(),
-                    'preserve_mac': fake.pybool(),
-                    'link_up': fake.pybool(),
-                    'link': fake.uuid4(cast_to=None),
+                    'name': 'eth0',
+                    'port_number': 22,
+                    'outbound': False,
+                    'preserve_mac': True,
+                    'link_up': False,
+                    'link': UUID(_LINK_ID),
                 },
                 True,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'port_number': fake.port_number(),
-                    'outbound': fake.pybool(),
-                    'preserve_mac': fake.pybool(),
-                    'link_up': fake.pybool(),
-                    'link': fake.uuid4(cast_to=str),
+                    'name': 'eth0',
+                    'port_number': 22,
+                    'outbound': True,
+                    'preserve_mac': False,
+                    'link_up': True,
+                    'link': _LINK_ID,
                 },
                 True,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'port_number': fake.port_number(),
-                    'outbound': fake.pybool(),
-                    'preserve_mac': fake.pybool(),
-                    'link_up': fake.pybool(),
+                    'name': 'eth0',
+                    'port_number': 22,
+                    'outbound': False,
+                    'preserve_mac': True,
+                    'link_up': False,
                     'link': None,
                 },
                 True,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'port_number': fake.port_number(),
-                    'outbound': fake.pybool(),
-                    'preserve_mac': fake.slug(),
-                    'link_up': fake.pybool(),
+                    'name': 'eth0',
+                    'port_number': 22,
+                    'outbound': True,
+                    'preserve_mac': 'not-a-bool',
+                    'link_up': False,
                     'link': None,
                 },
                 False,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'port_number': fake.port_number(),
-                    'outbound': fake.pybool(),
-                    'preserve_mac': fake.pybool(),
-                    'link_up': fake.pybool(),
+                    'name': 'eth0',
+                    'port_number': 22,
+                    'outbound': True,
+                    'preserve_mac': False,
+                    'link_up': True,
                 },
                 False,
             ),
         ),
     )
     def test_full_update(
-        self, api, run_full_update_patch_test, interface_factory, link_factory, payload, is_valid
+        self,
+        api,
+        run_full_update_patch_test,
+        resolve_placeholders,
+        interface_factory,
+        link_factory,
+        payload,
+        is_valid,
     ):
-        if payload.get('link') == 'use_real_link':
-            payload['link'] = link_factory(api)
+        payload = resolve_placeholders(payload, {'use_real_link': lambda: link_factory(api)})
         run_full_update_patch_test(api.interfaces, interface_factory, payload, is_valid)
@@ -2,10 +2,6 @@
 # SPDX-License-Identifier: MIT
 
 import pytest
-import faker
-
-faker.Faker.seed(0)
-fake = faker.Faker()
 
 
 class TestJobEndpointApi:
@@ -24,8 +20,8 @@ class TestJobEndpointApi:
         'payload,is_valid',
         (
             ({}, False),
-            ({'fake_param': fake.slug()}, False),
-            ({'state': fake.pyint()}, False),
+            ({'fake_param': 'some-value'}, False),
+            ({'state': 42}, False),
             ({'state': None}, False),
             ({'state': False}, False),
             ({'state': 'COMPLETE'}, True),
@@ -1,63 +1,67 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
-import json
 from http import HTTPStatus
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
-import faker
 
+from air_sdk.v2.endpoints.mixins import to_serializable
 from air_sdk.v2.utils import join_urls
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_SIMULATION_ID = '0c9d8e7f-6a5b-4c3d-8e2f-1a0b9c8d7e6f'
+_INTERFACE_ID = '1f2e3d4c-5b6a-4798-8a9b-c0d1e2f3a4b5'
+_OTHER_INTERFACE_ID = '6a5b4c3d-2e1f-4a0b-9c8d-7e6f5a4b3c2d'
+_LINK_ID = '9e8d7c6b-5a4f-4e3d-8c2b-1a0f9e8d7c6b'
+_OTHER_LINK_ID = '2b3c4d5e-6f7a-4b8c-9d0e-1f2a3b4c5d6e'
+
+# Strings starting with `use_` are replaced with model instances (or their ids) by `test_bulk_delete`
+_BULK_DELETE_CASES = (
+    ({}, False),
+    ({'simulation': None, 'links': None}, False),
+    ({'simulation': 'use_simulation', 'links': 'use_simulation'}, False),
+    ({'simulation': 'use_simulation', 'links': []}, False),
+    ({'simulation': 'use_simulation', 'links': None}, True),
+    ({'simulation': 'use_unsaved_simulation', 'links': None}, False),
+    ({'simulation': 'use_simulation', 'links': [None]}, False),
+    ({'simulation': 'use_simulation', 'links': [42]}, False),
+    ({'simulation': 'use_interface', 'links': [_LINK_ID]}, False),
+    ({'simulation': 'use_simulation', 'links': [_LINK_ID]}, True),
+    ({'simulation': 'use_simulation_id', 'links': [_LINK_ID]}, True),
+    ({'simulation': 'use_simulation_id_str', 'links': [_LINK_ID]}, True),
+    ({'simulation': 'use_simulation', 'links': [UUID(_LINK_ID)]}, True),
+    ({'simulation': 'use_simulation', 'links': ['use_link', 'use_link']}, True),
+    ({'simulation': 'use_simulation', 'links': [_LINK_ID, UUID(_OTHER_LINK_ID), 'use_link']}, True),
+)
 
 
 class TestLinkEndpointApi:
-    def test_list(self, setup_mock_responses, api, link_factory):
-        endpoint_api = api.links
-        results = [
-            json.loads(link_factory(endpoint_api.__api__).json()),
-            json.loads(link_factory(endpoint_api.__api__).json()),
-        ]
-        setup_mock_responses(
-            {
-                ('GET', endpoint_api.url): {
-                    'json': {'previous': None, 'next': None, 'count': len(results), 'results': results},
-                    'status_code': HTTPStatus.OK,
-                }
-            }
-        )
-        # Test SDK
-        links = list(endpoint_api.list(simulation=fake.uuid4(cast_to=str), limit=len(results)))
-        assert len(links) == len(results)
-        assert isinstance(links[0], endpoint_api.model)
+    def test_list(self, run_list_test, api, link_factory):
+        links = run_list_test(api.links, link_factory, simulation=str(uuid4()))
         for link in links:
             assert link.id is not None
             for sim_iface in link.simulation_interfaces:
                 assert isinstance(sim_iface.__pk__, UUID)
-                assert isinstance(sim_iface.__pk__, UUID)
 
     @pytest.mark.parametrize(
         'payload,is_valid',
         (
             ({}, False),
             ({'simulation': None, 'links': None}, False),
-            ({'simulation': fake.uuid4(cast_to=str), 'links': None}, False),
-            ({'simulation': fake.uuid4(cast_to=str), 'links': []}, False),
-            ({'simulation': fake.uuid4(cast_to=str), 'links': [fake.uuid4(cast_to=str)]}, False),
+            ({'simulation': _SIMULATION_ID, 'links': None}, False),
+            ({'simulation': _SIMULATION_ID, 'links': []}, False),
+            ({'simulation': _SIMULATION_ID, 'links': [_INTERFACE_ID]}, False),
             (
                 {
-                    'simulation': fake.uuid4(cast_to=str),
-                    'links': [{'simulation_interfaces': [fake.uuid4(cast_to=str), fake.uuid4(cast_to=str)]}],
+                    'simulation': _SIMULATION_ID,
+                    'links': [{'simulation_interfaces': [_INTERFACE_ID, _OTHER_INTERFACE_ID]}],
                 },
                 True,
             ),
             (
                 {
-                    'simulation': fake.uuid4(cast_to=str),
-                    'links': [{'simulation_interfaces': [fake.uuid4(cast_to=str), fake.uuid4(cast_to=str)]}],
-                    'extra_field': fake.slug(),
+                    'simulation': _SIMULATION_ID,
+                    'links': [{'simulation_interfaces': [_INTERFACE_ID, _OTHER_INTERFACE_ID]}],
+                    'extra_field': 'some-value',
                 },
                 False,
             ),
@@ -75,11 +79,8 @@ class TestLinkEndpointApi:
             setup_mock_responses(
                 {
                     ('POST', join_urls(endpoint_api.url, 'bulk-create')): {
-                        'json': (
-                            {
-                                'simulation': payload_sim,
-                                'links': [json.loads(link.json()) for link in expected_links],
-                            }
+                        'json': to_serializable(
+                            {'simulation': payload_sim, 'links': [link.dict() for link in expected_links]}
                         ),
                         'status_code': HTTPStatus.CREATED,
                     }
@@ -94,53 +95,47 @@ class TestLinkEndpointApi:
                 endpoint_api.bulk_create(**payload)
             assert err.type in (TypeError, ValueError)
 
+    @pytest.mark.parametrize('params,is_valid', _BULK_DELETE_CASES)
     def test_bulk_delete(
-        self, setup_mock_responses, api, simulation_factory, interface_factory, link_factory
+        self,
+        setup_mock_responses,
+        resolve_placeholders,
+        api,
+        simulation_factory,
+        interface_factory,
+        link_factory,
+        params,
+        is_valid,
     ):
+        def _unsaved_simulation():
+            unsaved_sim = simulation_factory(api)
+            setattr(unsaved_sim, unsaved_sim.primary_key_field, None)
+            return unsaved_sim
+
+        endpoint_api = api.links
         simulation_inst = simulation_factory(api)
-        unsaved_sim = simulation_factory(api)
-        setattr(unsaved_sim, unsaved_sim.primary_key_field, None)
-        interface_inst = interface_factory(api)
-        link_inst = link_factory(api)
-        alt_link_inst = link_factory(api)
-        cases = [
-            ({}, False),
-            ({'simulation': None, 'links': None}, False),
-            ({'simulation': simulation_inst, 'links': simulation_inst}, False),
-            ({'simulation': simulation_inst, 'links': []}, False),
-            ({'simulation': simulation_inst, 'links': None}, True),
-            ({'simulation': unsaved_sim, 'links': None}, False),
-            ({'simulation': simulation_inst, 'links': [None]}, False),
-            ({'simulation': simulation_inst, 'links': [fake.pyint()]}, False),
-            ({'simulation': interface_inst, 'links': [fake.uuid4(cast_to=str)]}, False),
-            ({'simulation': simulation_inst, 'links': [fake.uuid4(cast_to=str)]}, True),
-            ({'simulation': simulation_inst.id, 'links': [fake.uuid4(cast_to=str)]}, True),
-            ({'simulation': str(simulation_inst.id), 'links': [fake.uuid4(cast_to=str)]}, True),
-            ({'simulation': simulation_inst, 'links': [fake.uuid4(cast_to=None)]}, True),
-            ({'simulation': simulation_inst, 'links': [link_inst, alt_link_inst]}, True),
-            (
+        placeholders = {
+            'use_simulation': lambda: simulation_inst,
+            'use_simulation_id': lambda: simulation_inst.id,
+            'use_simulation_id_str': lambda: str(simulation_inst.id),
+            'use_unsaved_simulation': _unsaved_simulation,
+            'use_interface': lambda: interface_factory(api),
+            'use_link': lambda: link_factory(api),
+        }
+        params = resolve_placeholders(params, placeholders)
+        if is_valid:
+            link_ids = params.get('links') or []
+            setup_mock_responses(
                 {
-                    'simulation': simulation_inst,
-                    'links': [fake.uuid4(cast_to=str), fake.uuid4(cast_to=None), link_inst],
-                },
-                True,
-            ),
-        ]
-        for i, (params, is_valid) in enumerate(cases):
-            failure_msg = f'Failed on case {i}'
-            if is_valid:
-                link_ids = params.get('links') or []
-                setup_mock_responses(
-                    {
-                        ('DELETE', join_urls(api.links.url, 'bulk-delete')): {
-                            'json': {'links_deleted': len(link_ids)},
-                            'status_code': HTTPStatus.OK,
-                        }
+                    ('DELETE', join_urls(endpoint_api.url, 'bulk-delete')): {
+                        'json': {'links_deleted': len(link_ids)},
+                        'status_code': HTTPStatus.OK,
                     }
-                )
-                deletion_data = api.links.bulk_delete(**params)
-                assert deletion_data['links_deleted'] == len(link_ids), failure_msg
-            else:
-                with pytest.raises(Exception) as err:
-                    api.links.bulk_delete(**params)
-                assert err.type in (TypeError, ValueError), failure_msg
+                }
+            )
+            deletion_data = endpoint_api.bulk_delete(**params)
+            assert deletion_data['links_deleted'] == len(link_ids)
+        else:
+            with pytest.raises(Exception) as err:
+                endpoint_api.bulk_delete(**params)
+            assert err.type in (TypeError, ValueError)
@@ -1,44 +1,169 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
-import json
 import uuid
 from http import HTTPStatus
 
 import pytest
-import faker
 
 from air_sdk import v2
+from air_sdk.v2.endpoints.mixins import to_serializable
 
+_NAME = 'Demo Lab'
+_SLUG = 'demo-lab'
+_SNAPSHOT_ID = '4f3e2d1c-0b9a-4887-a6b5-c4d3e2f1a0b9'
+_OWNER_ID = 'a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d'
+_URL = 'https://example.com/demo-lab'
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+# Strings starting with `use_` are replaced with model instances, or with the factory's default
+# description and tags, by the tests using these cases
+# Partial updates set a single field, so their cases are listed as `(value, is_valid)` per field
+_UPDATE_FIELD_CASES = {
+    'name': (
+        (None, True),
+        (_SLUG, True),
+        (42, False),
+    ),
+    'snapshot': (
+        (None, True),
+        (_SNAPSHOT_ID, True),
+        (uuid.UUID(_SNAPSHOT_ID), True),
+        ('use_simulation', True),
+        (True, False),
+        (42, False),
+    ),
+    'description': (
+        (None, True),
+        ('use_default_text', True),
+        (42, False),
+    ),
+    'documentation': (
+        (None, True),
+        (_URL, True),
+        (_SLUG, True),
+        (True, False),
+    ),
+    'repo': (
+        (None, True),
+        (_URL, True),
+        (_SLUG, True),
+        (42, False),
+    ),
+    'icon': (
+        (None, True),
+        ('use_default_text', True),
+        (42, False),
+    ),
+    'owner': (
+        (None, True),
+        (uuid.UUID(_OWNER_ID), True),
+        (_OWNER_ID, True),
+        (42, False),
+    ),
+    'tags': (
+        (None, True),
+        ([], True),
+        ('use_default_tags', True),
+        (['use_tag'], True),
+        (['use_tag', 'use_tag', 'use_tag'], True),
+        (['use_simulation'], False),
+    ),
+    'published': (
+        (None, True),
+        (True, True),
+        (_SLUG, False),
+    ),
+}
+_UPDATE_CASES = (
+    ({}, True),
+    *(
+        ({field: value}, is_valid)
+        for field, cases in _UPDATE_FIELD_CASES.items()
+        for value, is_valid in cases
+    ),
+)
 
+_FULL_UPDATE_CASES = (
+    ({}, False),
+    (
+        {
+            'name': _SLUG,
+            'snapshot': _SNAPSHOT_ID,
+            'description': None,
+            'documentation': None,
+            'repo': None,
+            'icon': None,
+            'owner': None,
+            'tags': None,
+            'published': None,
+        },
+        False,
+    ),
+    (
+        {
+            'name': _SLUG,
+            'snapshot': _SNAPSHOT_ID,
+            'description': 'use_default_text',
+            'documentation': _URL,
+            'repo': _URL,
+            'icon': 'use_default_text',
+            'owner': _OWNER_ID,
+            'tags': 'use_default_tags',
+            'published': True,
+        },
+        True,
+    ),
+    (
+        {
+            'name': _SLUG,
+            'snapshot': _SNAPSHOT_ID,
+            'description': None,
+            'documentation': None,
+            'repo': None,
+            'icon': None,
+            'owner': _OWNER_ID,
+            'tags': 'use_default_tags',
+            'published': True,
+        },
+        True,
+    ),
+    (
+        {
+            'name': _SLUG,
+            'snapshot': 'use_simulation',
+            'description': 'use_default_text',
+            'documentation': _URL,
+            'repo': _URL,
+            'icon': 'use_default_text',
+            'owner': uuid.UUID(_OWNER_ID),
+            'tags': ['use_tag', 'use_tag', 'use_tag'],
+            'published': True,
+        },
+        True,
+    ),
+)
 
-class TestMarketplaceDemoEndpointApi:
-    def setup_method(self):
-        self.AirApi = v2.AirApi
-        self.api_url = 'https://air-fake-test.nvidia.com/api/'
-        self.api = v2.AirApi(api_url=self.api_url, authenticate=False)
-        self.endpoint_url = v2.utils.join_urls(self.api_url, 'v2', self.api.marketplace_demos.API_PATH)
 
-    def test_get(self, setup_mock_responses, marketplace_demo_factory):
-        inst = marketplace_demo_factory(self.api)
+class TestMarketplaceDemoEndpointApi:
+    def test_get(self, api, setup_mock_responses, marketplace_demo_factory):
+        endpoint_api = api.marketplace_demos
+        inst = marketplace_demo_factory(api)
         # Set up mock client
-        detail_url = v2.utils.join_urls(self.endpoint_url, inst.id)
+        detail_url = v2.utils.join_urls(endpoint_api.url, inst.id)
         expected_responses = {
             ('GET', detail_url): {
-                'json': json.loads(inst.json()),  # Create a response representing the current inst
+                'json': to_serializable(inst.dict()),  # Create a response representing the current inst
                 'status_code': 200,
             }
         }
         setup_mock_responses(expected_responses)
         # Test SDK
-        marketplace_demo = self.api.marketplace_demos.get(pk=inst.id)
+        marketplace_demo = endpoint_api.get(pk=inst.id)
         assert marketplace_demo.dict() == inst.dict()
 
-    def test_lazy_snapshot(self, setup_mock_responses, marketplace_demo_factory, simulation_factory):
-        sim = simulation_factory(self.api)
-        inst = marketplace_demo_factory(self.api, snapshot=str(sim.id))
+    def test_lazy_snapshot(self, api, setup_mock_responses, marketplace_demo_factory, simulation_factory):
+        sim = simulation_factory(api)
+        sim_data = sim.dict()
+        inst = marketplace_demo_factory(api, snapshot=str(sim.id))
         assert hasattr(inst, 'snapshot')
         assert isinstance(inst.snapshot, v2.air_model.ForeignKeyMixin)
         assert inst.snapshot.__fk_resolved__ is False
@@ -46,16 +171,16 @@ class TestMarketplaceDemoEndpointApi:
         assert isinstance(snapshot_pk, uuid.UUID)
 
         # Set up mock client for resolution of lazy snapshot field
-        simulation_details_url = v2.utils.join_urls(self.api.simulations.url, str(snapshot_pk))
+        simulation_details_url = v2.utils.join_urls(api.simulations.url, str(snapshot_pk))
         setup_mock_responses(
             {
                 ('GET', simulation_details_url): {
-                    'json': json.loads(sim.json()),
+                    'json': to_serializable(sim_data),
                     'status_code': HTTPStatus.OK,
                 }
             }
         )
-        assert inst.snapshot.dict() == sim.dict()
+        assert inst.snapshot.dict() == sim_data
 
     def test_delete(self, api, run_delete_test, marketplace_demo_factory):
         run_delete_test(api.marketplace_demos, marketplace_demo_factory)
@@ -65,156 +190,85 @@ class TestMarketplaceDemoEndpointApi:
         (
             ({}, False),
             ({'name': None, 'snapshot': None}, False),
-            ({'name': fake.name(), 'snapshot': None}, False),
-            ({'name': None, 'snapshot': fake.uuid4(cast_to=str)}, False),
-            ({'name': fake.name(), 'snapshot': fake.uuid4(cast_to=str)}, True),
-            ({'name': fake.name(), 'snapshot': fake.uuid4(cast_to=str), 'published': True}, True),
+            ({'name': _NAME, 'snapshot': None}, False),
+            ({'name': None, 'snapshot': _SNAPSHOT_ID}, False),
+            ({'name': _NAME, 'snapshot': _SNAPSHOT_ID}, True),
+            ({'name': _NAME, 'snapshot': _SNAPSHOT_ID, 'published': True}, True),
             (
                 {
-                    'name': fake.name(),
-                    'snapshot': fake.uuid4(cast_to=str),
+                    'name': _NAME,
+                    'snapshot': _SNAPSHOT_ID,
                     'tags': '',
                 },
                 False,
             ),
             (
                 {
-                    'name': fake.name(),
-                    'snapshot': fake.uuid4(cast_to=str),
+                    'name': _NAME,
+                    'snapshot': _SNAPSHOT_ID,
                     'published': True,
-                    'documentation': fake.url(),
-                    'description': fake.text(),
-                    'repo': fake.url(),
-                    'icon': fake.url(),
-                    'owner': fake.uuid4(cast_to=str),
-                    'tags': fake.pylist(value_types=(str,)),
+                    'documentation': _URL,
+                    'description': 'use_default_text',
+                    'repo': _URL,
+                    'icon': _URL,
+                    'owner': _OWNER_ID,
+                    'tags': 'use_default_tags',
                 },
                 True,
             ),
         ),
     )
-    def test_create(self, api, marketplace_demo_factory, run_create_test_case, payload, is_valid):
+    def test_create(
+        self, api, marketplace_demo_factory, run_create_test_case, resolve_placeholders, payload, is_valid
+    ):
+        placeholders = {
+            'use_default_text': lambda: marketplace_demo_factory(api).description,
+            'use_default_tags': lambda: marketplace_demo_factory(api).tags,
+        }
+        payload = resolve_placeholders(payload, placeholders)
         run_create_test_case(api.marketplace_demos, marketplace_demo_factory, payload, is_valid)
 
     def test_refresh(self, api, run_refresh_test, marketplace_demo_factory):
         run_refresh_test(api.marketplace_demos, marketplace_demo_factory)
 
+    @pytest.mark.parametrize('payload,is_valid', _UPDATE_CASES)
     def test_update(
         self,
         api,
         run_update_patch_test,
+        resolve_placeholders,
         marketplace_demo_factory,
         marketplace_demo_tag_factory,
         simulation_factory,
+        payload,
+        is_valid,
     ):
-        cases = (
-            ({}, True),
-            ({'name': None}, True),
-            ({'name': fake.slug()}, True),
-            ({'name': fake.pyint()}, False),
-            ({'snapshot': None}, True),
-            ({'snapshot': fake.uuid4(cast_to=str)}, True),
-            ({'snapshot': fake.uuid4(cast_to=None)}, True),
-            ({'snapshot': simulation_factory(api)}, True),
-            ({'snapshot': fake.pybool()}, False),
-            ({'snapshot': fake.pyint()}, False),
-            ({'description': None}, True),
-            ({'description': fake.text()}, True),
-            ({'description': fake.pyint()}, False),
-            ({'documentation': None}, True),
-            ({'documentation': fake.url()}, True),
-            ({'documentation': fake.slug()}, True),
-            ({'documentation': fake.pybool()}, False),
-            ({'repo': None}, True),
-            ({'repo': fake.url()}, True),
-            ({'repo': fake.slug()}, True),
-            ({'repo': fake.pyint()}, False),
-            ({'icon': None}, True),
-            ({'icon': fake.text()}, True),
-            ({'icon': fake.pyint()}, False),
-            ({'owner': None}, True),
-            ({'owner': fake.uuid4(cast_to=None)}, True),
-            ({'owner': fake.uuid4(cast_to=str)}, True),
-            ({'owner': fake.pyint()}, False),
-            ({'tags': None}, True),
-            ({'tags': []}, True),
-            ({'tags': fake.pylist(value_types=(str,))}, True),
-            ({'tags': [marketplace_demo_tag_factory(api)]}, True),
-            ({'tags': [marketplace_demo_tag_factory(api) for _ in range(3)]}, True),
-            ({'tags': [simulation_factory(api)]}, False),
-            ({'published': None}, True),
-            ({'published': fake.pybool()}, True),
-            ({'published': fake.slug()}, False),
-        )
-        for payload, is_valid in cases:
-            run_update_patch_test(api.marketplace_demos, marketplace_demo_factory, payload, is_valid)
+        placeholders = {
+            'use_simulation': lambda: simulation_factory(api),
+            'use_tag': lambda: marketplace_demo_tag_factory(api),
+            'use_default_text': lambda: marketplace_demo_factory(api).description,
+            'use_default_tags': lambda: marketplace_demo_factory(api).tags,
+        }
+        payload = resolve_placeholders(payload, placeholders)
+        run_update_patch_test(api.marketplace_demos, marketplace_demo_factory, payload, is_valid)
 
+    @pytest.mark.parametrize('payload,is_valid', _FULL_UPDATE_CASES)
     def test_full_update(
         self,
         api,
         run_full_update_put_test,
+        resolve_placeholders,
         marketplace_demo_factory,
         marketplace_demo_tag_factory,
         simulation_factory,
+        payload,
+        is_valid,
     ):
-        cases = (
-            ({}, False),
-            (
-                {
-                    'name': fake.slug(),
-                    'snapshot': fake.uuid4(cast_to=str),
-                    'description': None,
-                    'documentation': None,
-                    'repo': None,
-                    'icon': None,
-                    'owner': None,
-                    'tags': None,
-                    'published': None,
-                },
-                False,
-            ),
-            (
-                {
-                    'name': fake.slug(),
-                    'snapshot': fake.uuid4(cast_to=str),
-                    'description': fake.text(),
-                    'documentation': fake.url(),
-                    'repo': fake.url(),
-                    'icon': fake.text(),
-                    'owner': fake.uuid4(cast_to=str),
-                    'tags': fake.pylist(value_types=(str,)),
-                    'published': fake.pybool(),
-                },
-                True,
-            ),
-            (
-                {
-                    'name': fake.slug(),
-                    'snapshot': fake.uuid4(cast_to=str),
-                    'description': None,
-                    'documentation': None,
-                    'repo': None,
-                    'icon': None,
-                    'owner': fake.uuid4(cast_to=str),
-                    'tags': fake.pylist(value_types=(str,)),
-                    'published': fake.pybool(),
-                },
-                True,
-            ),
-            (
-                {
-                    'name': fake.slug(),
-                    'snapshot': simulation_factory(api),
-                    'description': fake.text(),
-                    'documentation': fake.url(),
-                    'repo': fake.url(),
-                    'icon': fake.text(),
-                    'owner': fake.uuid4(cast_to=None),
-                    'tags': [marketplace_demo_tag_factory(api) for _ in range(3)],
-                    'published': fake.pybool(),
-                },
-                True,
-            ),
-        )
-        for payload, is_valid in cases:
-            run_full_update_put_test(api.marketplace_demos, marketplace_demo_factory, payload, is_valid)
+        placeholders = {
+            'use_simulation': lambda: simulation_factory(api),
+            'use_tag': lambda: marketplace_demo_tag_factory(api),
+            'use_default_text': lambda: marketplace_demo_factory(api).description,
+            'use_default_tags': lambda: marketplace_demo_factory(api).tags,
+        }
+        payload = resolve_placeholders(payload, placeholders)
+        run_full_update_put_test(api.marketplace_demos, marketplace_demo_factory, payload, is_valid)
@@ -2,14 +2,132 @@
 # SPDX-License-Identifier: MIT
 import json
 from http import HTTPStatus
+from uuid import UUID
 
 import pytest
-import faker
 
+from air_sdk.v2.endpoints.mixins import to_serializable
 from air_sdk.v2.utils import join_urls
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_SIMULATION_ID = '6e5d4c3b-2a1f-4e0d-9c8b-7a6f5e4d3c2b'
+_OS_ID = 'b2c3d4e5-f6a7-4b8c-9d0e-1f2a3b4c5d6e'
+_SYSTEM_ID = 'c3d4e5f6-a7b8-4c9d-8e0f-2a3b4c5d6e7f'
+_NAME = 'leaf01'
+_CONSOLE_USERNAME = 'cumulus'
+_CONSOLE_PASSWORD = 'CumulusLinux!'
+_AGENT_KEY = 'f0e1d2c3-b4a5-4697-8879-6a5b4c3d2e1f'
+_NODE_IDS = (
+    '0a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d',
+    '1b2c3d4e-5f6a-4b7c-9d8e-0f1a2b3c4d5e',
+    '2c3d4e5f-6a7b-4c8d-8e9f-1a2b3c4d5e6f',
+    '3d4e5f6a-7b8c-4d9e-9f0a-2b3c4d5e6f7a',
+)
+_NODE_DATA = json.dumps({'key': 'value'})
+_NOT_A_NUMBER = 'not-a-number'
+
+_UPDATE_CASES = (
+    # Empty Case
+    ({}, True),
+    # None cases
+    ({'name': None}, True),
+    ({'state': None}, True),
+    ({'pos_x': None}, True),
+    ({'pos_y': None}, True),
+    ({'boot_group': None}, True),
+    ({'console_username': None}, True),
+    ({'console_password': None}, True),
+    ({'console_port': None}, True),
+    ({'serial_port': None}, True),
+    # Valid payload cases
+    ({'name': _NAME}, True),
+    ({'state': 'COMPLETE'}, True),
+    ({'state': 'FAILURE'}, True),
+    ({'pos_x': 3.5}, True),
+    ({'pos_y': -1.25}, True),
+    ({'boot_group': 2}, True),
+    ({'console_username': _CONSOLE_USERNAME}, True),
+    ({'console_password': _CONSOLE_PASSWORD}, True),
+    ({'console_port': 2222}, True),
+    ({'serial_port': 2223}, True),
+    # Invalid values cases
+    ({'name': 42}, False),
+    ({'state': True}, False),
+    ({'pos_x': _NOT_A_NUMBER}, False),
+    ({'pos_y': _NOT_A_NUMBER}, False),
+    ({'boot_group': _NOT_A_NUMBER}, False),
+    ({'console_username': 42}, False),
+    ({'console_password': 42}, False),
+    ({'console_port': _NOT_A_NUMBER}, False),
+    ({'serial_port': _NOT_A_NUMBER}, False),
+    # Unexpected payload value case
+    ({'unexpected_key': 'unexpected-value'}, False),
+)
+
+_FULL_UPDATE_CASES = (
+    # Empty Case
+    ({}, False),
+    # Full valid data case
+    (
+        {
+            'name': _NAME,
+            'state': 'COMPLETE',
+            'pos_x': 3.5,
+            'pos_y': -1.25,
+            'boot_group': 2,
+            'console_username': _CONSOLE_USERNAME,
+            'console_password': _CONSOLE_PASSWORD,
+            'console_port': 2222,
+            'serial_port': 2223,
+        },
+        True,
+    ),
+    # Minimal valid data case
+    (
+        {
+            'name': _NAME,
+            'state': 'COMPLETE',
+            'pos_x': 3.5,
+            'pos_y': -1.25,
+            'boot_group': None,
+            'console_username': None,
+            'console_password': None,
+            'console_port': None,
+            'serial_port': None,
+        },
+        True,
+    ),
+    # Invalid None case
+    (
+        {
+            'name': None,
+            'state': None,
+            'pos_x': None,
+            'pos_y': None,
+            'boot_group': None,
+            'console_username': None,
+            'console_password': None,
+            'console_port': None,
+            'serial_port': None,
+        },
+        False,
+    ),
+    # Unexpected value case
+    (
+        {
+            'name': _NAME,
+            'state': 'COMPLETE',
+            'pos_x': 3.5,
+            'pos_y': -1.25,
+            'boot_group': None,
+            'console_username': None,
+            'console_password': None,
+            'console_port': None,
+            'serial_port': None,
+            'unexpected_key': 'unexpected-value',
+        },
+        False,
+    ),
+)
 
 
 class TestNodeEndpointApi:
@@ -27,20 +145,20 @@ class TestNodeEndpointApi:
         (
             ({}, False),
             ({'simulation': None, 'name': None}, False),
-            ({'simulation': fake.uuid4(cast_to=str), 'name': fake.slug()}, True),
-            ({'simulation': fake.uuid4(cast_to=str), 'name': fake.slug(), 'pos_x': None}, False),
+            ({'simulation': _SIMULATION_ID, 'name': _NAME}, True),
+            ({'simulation': _SIMULATION_ID, 'name': _NAME, 'pos_x': None}, False),
             (
                 {
-                    'simulation': fake.uuid4(cast_to=str),
-                    'name': fake.slug(),
-                    'pos_x': fake.pyfloat(min_value=-10, max_value=10),
+                    'simulation': _SIMULATION_ID,
+                    'name': _NAME,
+                    'pos_x': -2.5,
                 },
                 True,
             ),
             (
                 {
-                    'simulation': fake.uuid4(cast_to=str),
-                    'name': fake.slug(),
+                    'simulation': _SIMULATION_ID,
+                    'name': _NAME,
                     'boot_group': None,
                     'os': None,
                     'system': None,
@@ -54,18 +172,18 @@ class TestNodeEndpointApi:
             ),
             (
                 {
-                    'simulation': fake.uuid4(cast_to=str),
-                    'name': fake.slug(),
-                    'boot_group': fake.pyint(),
-                    'features': json.dumps(fake.pydict(value_types=(str,))),
-                    'metadata': json.dumps(fake.pydict(value_types=(str,))),
-                    'memory': fake.pyint(),
-                    'storage': fake.pyint(),
-                    'cpu': fake.pyint(),
-                    'os': fake.uuid4(cast_to=str),
-                    'system': fake.uuid4(cast_to=str),
-                    'console_username': fake.uuid4(cast_to=str),
-                    'console_password': fake.uuid4(cast_to=str),
+                    'simulation': _SIMULATION_ID,
+                    'name': _NAME,
+                    'boot_group': 2,
+                    'features': _NODE_DATA,
+                    'metadata': _NODE_DATA,
+                    'memory': 1024,
+                    'storage': 10,
+                    'cpu': 2,
+                    'os': _OS_ID,
+                    'system': _SYSTEM_ID,
+                    'console_username': _CONSOLE_USERNAME,
+                    'console_password': _CONSOLE_PASSWORD,
                 },
                 True,
             ),
@@ -75,124 +193,22 @@ class TestNodeEndpointApi:
         """This tests that the data provided is properly validated and used."""
         run_create_test_case(api.nodes, node_factory, payload, is_valid)
 
-    def test_update(self, api, run_update_patch_test, node_factory):
-        cases = (
-            # Empty Case
-            ({}, True),
-            # None cases
-            ({'name': None}, True),
-            ({'state': None}, True),
-            ({'pos_x': None}, True),
-            ({'pos_y': None}, True),
-            ({'boot_group': None}, True),
-            ({'console_username': None}, True),
-            ({'console_password': None}, True),
-            ({'console_port': None}, True),
-            ({'serial_port': None}, True),
-            # Valid payload cases
-            ({'name': fake.slug()}, True),
-            ({'state': 'COMPLETE'}, True),
-            ({'state': 'FAILURE'}, True),
-            ({'pos_x': fake.pyfloat()}, True),
-            ({'pos_y': fake.pyfloat()}, True),
-            ({'boot_group': fake.pyint()}, True),
-            ({'console_username': fake.uuid4(cast_to=str)}, True),
-            ({'console_password': fake.uuid4(cast_to=str)}, True),
-            ({'console_port': fake.port_number()}, True),
-            ({'serial_port': fake.port_number()}, True),
-            # Invalid values cases
-            ({'name': fake.pyint()}, False),
-            ({'state': fake.pybool()}, False),
-            ({'pos_x': fake.slug()}, False),
-            ({'pos_y': fake.slug()}, False),
-            ({'boot_group': fake.slug()}, False),
-            ({'console_username': fake.pyint()}, False),
-            ({'console_password': fake.pyint()}, False),
-            ({'console_port': fake.slug()}, False),
-            ({'serial_port': fake.slug()}, False),
-            # Unexpected payload value case
-            ({fake.slug().replace('-', '_'): fake.slug()}, False),
-        )
-        for payload, is_valid in cases:
-            run_update_patch_test(api.nodes, node_factory, payload, is_valid)
+    @pytest.mark.parametrize('payload,is_valid', _UPDATE_CASES)
+    def test_update(self, api, run_update_patch_test, node_factory, payload, is_valid):
+        run_update_patch_test(api.nodes, node_factory, payload, is_valid)
 
-    def test_full_update(self, api, run_full_update_patch_test, node_factory):
-        cases = (
-            # Empty Case
-            ({}, False),
-            # Full valid data case
-            (
-                {
-                    'name': fake.slug(),
-                    'state': 'COMPLETE',
-                    'pos_x': fake.pyfloat(),
-                    'pos_y': fake.pyfloat(),
-                    'boot_group': fake.pyint(),
-                    'console_username': fake.uuid4(cast_to=str),
-                    'console_password': fake.uuid4(cast_to=str),
-                    'console_port': fake.port_number(),
-                    'serial_port': fake.port_number(),
-                },
-                True,
-            ),
-            # Minimal valid data case
-            (
-                {
-                    'name': fake.slug(),
-                    'state': 'COMPLETE',
-                    'pos_x': fake.pyfloat(),
-                    'pos_y': fake.pyfloat(),
-                    'boot_group': None,
-                    'console_username': None,
-                    'console_password': None,
-                    'console_port': None,
-                    'serial_port': None,
-                },
-                True,
-            ),
-            # Invalid None case
-            (
-                {
-                    'name': None,
-                    'state': None,
-                    'pos_x': None,
-                    'pos_y': None,
-                    'boot_group': None,
-                    'console_username': None,
-                    'console_password': None,
-                    'console_port': None,
-                    'serial_port': None,
-                },
-                False,
-            ),
-            # Unexpected value case
-            (
-                {
-                    'name': fake.slug(),
-                    'state': 'COMPLETE',
-                    'pos_x': fake.pyfloat(),
-                    'pos_y': fake.pyfloat(),
-                    'boot_group': None,
-                    'console_username': None,
-                    'console_password': None,
-                    'console_port': None,
-                    'serial_port': None,
-                    fake.slug().replace('-', '_'): fake.slug(),
-                },
-                False,
-            ),
-        )
-        for payload, is_valid in cases:
-            run_full_update_patch_test(api.nodes, node_factory, payload, is_valid)
+    @pytest.mark.parametrize('payload,is_valid', _FULL_UPDATE_CASES)
+    def test_full_update(self, api, run_full_update_patch_test, node_factory, payload, is_valid):
+        run_full_update_patch_test(api.nodes, node_factory, payload, is_valid)
 
     @pytest.mark.parametrize(
         'payload,is_valid',
         (
             ({}, False),
-            ({'unexpected_key': fake.slug()}, False),
-            ({'agent_key': fake.pyint()}, False),
-            ({'agent_key': fake.slug()}, True),
-            ({'agent_key': fake.uuid4(cast_to=str)}, True),
+            ({'unexpected_key': 'unexpected-value'}, False),
+            ({'agent_key': 42}, False),
+            ({'agent_key': 'agent-key'}, True),
+            ({'agent_key': _AGENT_KEY}, True),
             ({'agent_key': None}, True),
         ),
     )
@@ -200,9 +216,9 @@ class TestNodeEndpointApi:
         endpoint_api = api.nodes
         model_factory = node_factory
         instance = model_factory(endpoint_api.__api__)
-        response_data = {'json': json.loads(instance.json()), 'status_code': HTTPStatus.OK}
         method = instance.set_agent_key
         if is_valid:
+            response_data = {'json': to_serializable(instance.dict()), 'status_code': HTTPStatus.OK}
             detail_url = join_urls(endpoint_api.url, str(instance.__pk__))
             setup_mock_responses({('PATCH', detail_url): response_data, ('GET', detail_url): response_data})
             method(**payload)
@@ -214,19 +230,19 @@ class TestNodeEndpointApi:
     def test_cloud_init(self, api, setup_mock_responses, node_factory, cloud_init_factory):
         node = node_factory(api)
         endpoint_api = api.cloud_inits
-        url = endpoint_api.url.format(id=str(node.id))
+        node_id = str(node.id)
+        url = endpoint_api.url.format(id=node_id)
         expected_inst = cloud_init_factory(api, simulation_node=node)
-        updated_data = json.loads(expected_inst.json())
-        updated_data['user_data'] = None
-        updated_data['meta_data'] = None
+        expected_data = to_serializable(expected_inst.dict())
+        updated_data = {**expected_data, 'user_data': None, 'meta_data': None}
         setup_mock_responses(
             {
-                ('GET', url): {'json': json.loads(expected_inst.json()), 'status_code': HTTPStatus.OK},
+                ('GET', url): {'json': expected_data, 'status_code': HTTPStatus.OK},
                 ('PATCH', url): {'json': updated_data, 'status_code': HTTPStatus.OK},
             },
         )
         cloud_init = node.cloud_init
-        assert str(cloud_init.simulation_node.__pk__) == str(node.__pk__)
+        assert str(cloud_init.simulation_node.__pk__) == node_id
         assert cloud_init.user_data is not None
         assert cloud_init.meta_data is not None
         cloud_init.full_update(user_data=None, meta_data=None)
@@ -237,25 +253,25 @@ class TestNodeEndpointApi:
         'payload,is_valid',
         (
             ([], True),
-            ([{'state': 'RUNNING', 'ids': [fake.uuid4(), fake.uuid4()]}], True),
-            ([{'state': 'RUNNING', 'ids': [str(fake.uuid4()), str(fake.uuid4())]}], True),
+            ([{'state': 'RUNNING', 'ids': list(_NODE_IDS[:2])}], True),
+            ([{'state': 'RUNNING', 'ids': list(_NODE_IDS[2:])}], True),
             (
                 [
-                    {'state': 'RUNNING', 'ids': [fake.uuid4(), fake.uuid4()]},
-                    {'state': 'PAUSED', 'ids': [fake.uuid4(), fake.uuid4()]},
+                    {'state': 'RUNNING', 'ids': list(_NODE_IDS[:2])},
+                    {'state': 'PAUSED', 'ids': list(_NODE_IDS[2:])},
                 ],
                 True,
             ),
             (
                 {
-                    'RUNNING': [fake.uuid4(), fake.uuid4()],
-                    'PAUSED': [fake.uuid4(), fake.uuid4()],
+                    'RUNNING': list(_NODE_IDS[:2]),
+                    'PAUSED': list(_NODE_IDS[2:]),
                 },
                 False,
             ),
         ),
     )
-    def test_bulk_update_state(self, api, setup_mock_responses, node_factory, payload, is_valid):
+    def test_bulk_update_state(self, api, setup_mock_responses, payload, is_valid):
         """Ensure the `bulk_update_state` method is reliable."""
         method = api.nodes.bulk_update_state
         setup_mock_responses(
@@ -271,3 +287,17 @@ class TestNodeEndpointApi:
             with pytest.raises(Exception) as err:
                 method(payload)
             assert err.type in (TypeError, ValueError)
+
+    @pytest.mark.parametrize('node_count', (10, 1000))
+    def test_bulk_update_state_large_payload(self, api, mock_client, setup_mock_responses, node_count):
+        """Ensure every node id is sent when many nodes are updated at once."""
+        node_ids = [str(UUID(int=i, version=4)) for i in range(node_count)]
+        setup_mock_responses(
+            {
+                ('PATCH', join_urls(api.nodes.url, 'bulk-update-state')): {
+                    'status_code': HTTPStatus.OK,
+                }
+            },
+        )
+        assert api.nodes.bulk_update_state([{'state': 'RUNNING', 'ids': node_ids}]) is None
+        assert mock_client.last_request.json() == [{'state': 'RUNNING', 'ids': node_ids}]
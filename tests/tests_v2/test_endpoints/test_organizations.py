@@ -4,12 +4,10 @@ import uuid
 from dataclasses import is_dataclass
 
 import pytest
-import faker
 
 from air_sdk.v2.exceptions import AirModelAttributeError
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_RESOURCE_BUDGET_ID = '7e6d5c4b-3a2f-4e1d-8c0b-9a8f7e6d5c4b'
 
 
 class TestOrganizationEndpointApi:
@@ -33,12 +31,12 @@ class TestOrganizationEndpointApi:
         'resource_budget,is_valid',
         (
             (None, False),
-            (fake.uuid4(cast_to=None), True),
-            (fake.uuid4(cast_to=str), True),
-            (fake.pyint(), False),
-            (fake.slug(), False),
+            (uuid.UUID(_RESOURCE_BUDGET_ID), True),
+            (_RESOURCE_BUDGET_ID, True),
+            (42, False),
+            ('not-a-uuid', False),
             ('use_factory', True),
-            ({'id': str(fake.uuid4(cast_to=str))}, True),
+            ({'id': _RESOURCE_BUDGET_ID}, True),
         ),
     )
     def test_resource_budget_access(
@@ -3,10 +3,11 @@
 
 
 import pytest
-import faker
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_NAME = 'ssh-service'
+_DEST_PORT = 22
+_INTERFACE_ID = '3c2b1a0f-9e8d-4c7b-a6f5-e4d3c2b1a0f9'
+_INVALID_STR = 'not-a-valid-value'
 
 
 class TestServiceEndpointApi:
@@ -21,32 +22,32 @@ class TestServiceEndpointApi:
         (
             ({}, False),
             ({'name': None, 'dest_port': None, 'interface': None}, False),
-            ({'name': fake.slug(), 'dest_port': fake.slug(), 'interface': fake.slug()}, False),
+            ({'name': _NAME, 'dest_port': _INVALID_STR, 'interface': _INVALID_STR}, False),
             (
                 {
-                    'name': fake.slug(),
-                    'dest_port': fake.slug(),
-                    'interface': fake.slug(),
+                    'name': _NAME,
+                    'dest_port': _INVALID_STR,
+                    'interface': _INVALID_STR,
                     'service_type': None,
                 },
                 False,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'dest_port': fake.slug(),
-                    'interface': fake.slug(),
-                    'service_type': fake.pyint(),
+                    'name': _NAME,
+                    'dest_port': _INVALID_STR,
+                    'interface': _INVALID_STR,
+                    'service_type': 123,
                 },
                 False,
             ),
-            ({'name': fake.slug(), 'dest_port': fake.pyint(), 'interface': fake.uuid4(cast_to=str)}, True),
+            ({'name': _NAME, 'dest_port': _DEST_PORT, 'interface': _INTERFACE_ID}, True),
             (
                 {
-                    'name': fake.slug(),
-                    'dest_port': fake.pyint(),
-                    'interface': fake.uuid4(cast_to=str),
-                    'service_type': fake.slug(),
+                    'name': _NAME,
+                    'dest_port': _DEST_PORT,
+                    'interface': _INTERFACE_ID,
+                    'service_type': 'ssh',
                 },
                 True,
             ),
@@ -1,24 +1,306 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
+import contextlib
 import itertools
 import json
-import tempfile
-from datetime import timezone
+from datetime import datetime, timezone
 from http import HTTPStatus
 from pathlib import Path
 from typing import cast, get_args
 from unittest.mock import MagicMock
 from uuid import UUID
 
-import faker
 import pytest
 
 import air_sdk.v2.endpoints.simulations
 from air_sdk.exceptions import AirUnexpectedResponse
+from air_sdk.v2.endpoints.mixins import to_serializable
 from air_sdk.v2.utils import join_urls
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_TITLE = 'Acme Lab'
+_SLUG = 'acme-lab'
+_URL = 'https://example.com/acme-lab'
+_DATETIME = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+_ORGANIZATION_ID = '5a4b3c2d-1e0f-4a9b-8c7d-6e5f4a3b2c1d'
+_WORKER_ID = '9f8e7d6c-5b4a-4392-8170-6f5e4d3c2b1a'
+_METADATA = json.dumps({'key': 'value'})
+
+_CREATE_FROM_DOCUMENTS = Path(__file__).parent / 'fixtures' / 'create_from' / 'json'
+_GOOD_DOCUMENT_PATH = _CREATE_FROM_DOCUMENTS / 'good_document.json'
+_INVALID_DOCUMENT_PATH = _CREATE_FROM_DOCUMENTS / 'invalid_document.json'
+_UNEXPECTED_DOCUMENT_PATH = _CREATE_FROM_DOCUMENTS / 'unexpected_document.json'
+
+# `use_worker` is replaced with a worker instance by `test_update`
+_UPDATE_CASES = (
+    # Empty Case
+    ({}, True),
+    # None cases
+    ({'documentation': None}, True),
+    ({'expires': None}, True),
+    ({'expires_at': None}, True),
+    ({'metadata': None}, True),
+    ({'preferred_worker': None}, True),
+    ({'sleep': None}, True),
+    ({'sleep_at': None}, True),
+    ({'title': None}, True),
+    # Valid data cases
+    ({'documentation': _URL}, True),
+    ({'documentation': _SLUG}, True),
+    ({'expires': True}, True),
+    ({'expires_at': _DATETIME}, True),
+    ({'metadata': _METADATA}, True),
+    ({'metadata': ''}, True),
+    ({'preferred_worker': _WORKER_ID}, True),
+    ({'preferred_worker': UUID(_WORKER_ID)}, True),
+    ({'preferred_worker': 'use_worker'}, True),
+    ({'sleep': True}, True),
+    ({'sleep_at': _DATETIME}, True),
+    ({'title': _TITLE}, True),
+    ({'title': _WORKER_ID}, True),
+    # Invalid data cases
+    ({'documentation': True}, False),
+    ({'documentation': 42}, False),
+    ({'expires': _SLUG}, False),
+    ({'expires_at': True}, False),
+    ({'metadata': {'key': 'value'}}, False),
+    ({'metadata': True}, False),
+    ({'preferred_worker': True}, False),
+    ({'sleep': _SLUG}, False),
+    ({'sleep_at': _SLUG}, False),
+    ({'sleep_at': True}, False),
+    ({'title': True}, False),
+    ({'title': 42}, False),
+    ({'title': UUID(_WORKER_ID)}, False),
+    # Unexpected field case
+    ({'unexpected_key': _SLUG}, False),
+)
+
+# `use_worker` is replaced with a worker instance by `test_full_update`
+_FULL_UPDATE_CASES = (
+    # Empty Case
+    ({}, False),
+    # Minimal data case
+    (
+        {
+            'documentation': None,
+            'expires': True,
+            'expires_at': _DATETIME,
+            'metadata': None,
+            'preferred_worker': None,
+            'sleep': True,
+            'sleep_at': _DATETIME,
+            'title': _TITLE,
+        },
+        True,
+    ),
+    # Full data cases
+    (
+        {
+            'documentation': _URL,
+            'expires': True,
+            'expires_at': _DATETIME,
+            'metadata': _METADATA,
+            'preferred_worker': 'use_worker',
+            'sleep': True,
+            'sleep_at': _DATETIME,
+            'title': _TITLE,
+        },
+        True,
+    ),
+    (
+        {
+            'documentation': _URL,
+            'expires': True,
+            'expires_at': _DATETIME,
+            'metadata': _METADATA,
+            'preferred_worker': UUID(_WORKER_ID),
+            'sleep': True,
+            'sleep_at': _DATETIME,
+            'title': _TITLE,
+        },
+        True,
+    ),
+    # Unexpected field case
+    (
+        {
+            'documentation': None,
+            'expires': True,
+            'expires_at': _DATETIME,
+            'metadata': None,
+            'preferred_worker': None,
+            'sleep': True,
+            'sleep_at': _DATETIME,
+            'title': _TITLE,
+            'unexpected_key': _SLUG,
+        },
+        False,
+    ),
+    # Missing data cases
+    (
+        {
+            'documentation': _URL,
+            'expires': True,
+            'expires_at': _DATETIME,
+            'metadata': _METADATA,
+            'sleep': True,
+            'sleep_at': _DATETIME,
+            'title': _TITLE,
+        },
+        False,
+    ),
+)
+
+# Contents starting with `use_` are replaced with open files or paths by `test_create_from`
+_CREATE_FROM_CASES = (
+    # Empty Case
+    ({}, False),
+    # Minimal data case
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': {},
+        },
+        True,
+    ),
+    # Explicit `organization=None`
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'organization': None,
+            'content': {},
+        },
+        True,
+    ),
+    # Assigned organization
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'organization': _SLUG,
+            'content': {},
+        },
+        True,
+    ),
+    # Full dictionary content
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': {
+                'oob': False,
+                'nodes': {'node-1': {'os': 'generic/ubuntu2204'}},
+                'links': [
+                    [
+                        {'node': 'node-1', 'interface': 'eth1'},
+                        {'node': 'node-1', 'interface': 'eth2'},
+                    ]
+                ],
+            },
+        },
+        True,
+    ),
+    # Valid string content
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': '{}',
+        },
+        True,
+    ),
+    # Valid path content
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': _GOOD_DOCUMENT_PATH,
+        },
+        True,
+    ),
+    # Valid file descriptor content
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': 'use_good_document_fd',
+        },
+        True,
+    ),
+    # Invalid format
+    (
+        {
+            'title': _SLUG,
+            'format': 'NOT_JSON',
+            'content': {},
+        },
+        False,
+    ),
+    # Non-existent file at path
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': 'use_non_existent_path',
+        },
+        False,
+    ),
+    # Invalid content (inline string)
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': 'invalid content',
+        },
+        False,
+    ),
+    # Invalid content (path)
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': _INVALID_DOCUMENT_PATH,
+        },
+        False,
+    ),
+    # Invalid content (file descriptor)
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': 'use_invalid_document_fd',
+        },
+        False,
+    ),
+    # Unexpected content (inline string)
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': '[]',
+        },
+        False,
+    ),
+    # Unexpected content (path)
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': _UNEXPECTED_DOCUMENT_PATH,
+        },
+        False,
+    ),
+    # Unexpected content (file descriptor)
+    (
+        {
+            'title': _SLUG,
+            'format': 'JSON',
+            'content': 'use_unexpected_document_fd',
+        },
+        False,
+    ),
+)
 
 
 class TestSimulation:
@@ -53,159 +335,74 @@ class TestSimulationEndpointApi:
         (
             ({}, False),
             ({'title': None}, False),
-            ({'title': fake.company()}, True),
-            ({'title': fake.company(), 'random_field': fake.slug()}, False),
+            ({'title': _TITLE}, True),
+            ({'title': _TITLE, 'random_field': _SLUG}, False),
             (
                 {
-                    'title': fake.company(),
-                    'documentation': fake.url(),
-                    'expires': fake.pybool(),
-                    'expires_at': fake.date_time(tzinfo=timezone.utc),
-                    'organization': fake.uuid4(cast_to=str),
-                    'metadata': json.dumps(fake.pydict(value_types=(str,))),
-                    'owner': fake.email(),
-                    'preferred_worker': fake.uuid4(cast_to=str),
-                    'sleep': fake.pybool(),
-                    'sleep_at': fake.date_time(tzinfo=timezone.utc),
+                    'title': _TITLE,
+                    'documentation': _URL,
+                    'expires': True,
+                    'expires_at': _DATETIME,
+                    'organization': _ORGANIZATION_ID,
+                    'metadata': _METADATA,
+                    'owner': 'owner@example.com',
+                    'preferred_worker': _WORKER_ID,
+                    'sleep': True,
+                    'sleep_at': _DATETIME,
                 },
                 True,
             ),
-            ({'title': fake.company(), 'preferred_worker': fake.pyint()}, False),
-            ({'title': fake.company(), 'organization': fake.pyint()}, False),
+            ({'title': _TITLE, 'preferred_worker': 42}, False),
+            ({'title': _TITLE, 'organization': 42}, False),
         ),
     )
     def test_create(self, api, simulation_factory, run_create_test_case, payload, is_valid):
         """This tests that the data provided is properly validated and used."""
         run_create_test_case(api.simulations, simulation_factory, payload, is_valid)
 
-    def test_update(self, api, run_update_patch_test, simulation_factory, worker_factory):
-        cases = (
-            # Empty Case
-            ({}, True),
-            # None cases
-            ({'documentation': None}, True),
-            ({'expires': None}, True),
-            ({'expires_at': None}, True),
-            ({'metadata': None}, True),
-            ({'preferred_worker': None}, True),
-            ({'sleep': None}, True),
-            ({'sleep_at': None}, True),
-            ({'title': None}, True),
-            # Valid data cases
-            ({'documentation': fake.url()}, True),
-            ({'documentation': fake.slug()}, True),
-            ({'expires': fake.pybool()}, True),
-            ({'expires_at': fake.date_time(tzinfo=timezone.utc)}, True),
-            ({'metadata': json.dumps(fake.pydict(value_types=(str,)))}, True),
-            ({'metadata': ''}, True),
-            ({'preferred_worker': fake.uuid4(cast_to=str)}, True),
-            ({'preferred_worker': fake.uuid4(cast_to=None)}, True),
-            ({'preferred_worker': worker_factory(api)}, True),
-            ({'sleep': fake.pybool()}, True),
-            ({'sleep_at': fake.date_time(tzinfo=timezone.utc)}, True),
-            ({'title': fake.company()}, True),
-            ({'title': fake.uuid4(cast_to=str)}, True),
-            # Invalid data cases
-            ({'documentation': fake.pybool()}, False),
-            ({'documentation': fake.pyint()}, False),
-            ({'expires': fake.slug()}, False),
-            ({'expires_at': fake.pybool()}, False),
-            ({'metadata': fake.pydict(value_types=(str,))}, False),
-            ({'metadata': fake.pybool()}, False),
-            ({'preferred_worker': fake.pybool()}, False),
-            ({'sleep': fake.slug()}, False),
-            ({'sleep_at': fake.slug()}, False),
-            ({'sleep_at': fake.pybool()}, False),
-            ({'title': fake.pybool()}, False),
-            ({'title': fake.pyint()}, False),
-            ({'title': fake.uuid4(cast_to=None)}, False),
-            # Unexpected field case
-            ({fake.slug().replace('-', '_'): fake.slug()}, False),
-        )
-        for payload, is_valid in cases:
-            run_update_patch_test(api.simulations, simulation_factory, payload, is_valid)
+    @pytest.mark.parametrize('payload,is_valid', _UPDATE_CASES)
+    def test_update(
+        self,
+        api,
+        run_update_patch_test,
+        resolve_placeholders,
+        simulation_factory,
+        worker_factory,
+        payload,
+        is_valid,
+    ):
+        payload = resolve_placeholders(payload, {'use_worker': lambda: worker_factory(api)})
+        run_update_patch_test(api.simulations, simulation_factory, payload, is_valid)
 
-    def test_full_update(self, api, run_full_update_patch_test, simulation_factory, worker_factory):
-        cases = (
-            # Empty Case
-            ({}, False),
-            # Minimal data case
-            (
-                {
-                    'documentation': None,
-                    'expires': fake.pybool(),
-                    'expires_at': fake.date_time(tzinfo=timezone.utc),
-                    'metadata': None,
-                    'preferred_worker': None,
-                    'sleep': fake.pybool(),
-                    'sleep_at': fake.date_time(tzinfo=timezone.utc),
-                    'title': fake.company(),
-                },
-                True,
-            ),
-            # Full data cases
-            (
-                {
-                    'documentation': fake.url(),
-                    'expires': fake.pybool(),
-                    'expires_at': fake.date_time(tzinfo=timezone.utc),
-                    'metadata': json.dumps(fake.pydict(value_types=(str,))),
-                    'preferred_worker': worker_factory(api),
-                    'sleep': fake.pybool(),
-                    'sleep_at': fake.date_time(tzinfo=timezone.utc),
-                    'title': fake.company(),
-                },
-                True,
-            ),
-            (
-                {
-                    'documentation': fake.url(),
-                    'expires': fake.pybool(),
-                    'expires_at': fake.date_time(tzinfo=timezone.utc),
-                    'metadata': json.dumps(fake.pydict(value_types=(str,))),
-                    'preferred_worker': fake.uuid4(cast_to=None),
-                    'sleep': fake.pybool(),
-                    'sleep_at': fake.date_time(tzinfo=timezone.utc),
-                    'title': fake.company(),
-                },
-                True,
-            ),
-            # Unexpected field case
-            (
-                {
-                    'documentation': None,
-                    'expires': fake.pybool(),
-                    'expires_at': fake.date_time(tzinfo=timezone.utc),
-                    'metadata': None,
-                    'preferred_worker': None,
-                    'sleep': fake.pybool(),
-                    'sleep_at': fake.date_time(tzinfo=timezone.utc),
-                    'title': fake.company(),
-                    fake.slug().replace('-', '_'): fake.slug(),
-                },
-                False,
-            ),
-            # Missing data cases
-            (
-                {
-                    'documentation': fake.url(),
-                    'expires': fake.pybool(),
-                    'expires_at': fake.date_time(tzinfo=timezone.utc),
-                    'metadata': json.dumps(fake.pydict(value_types=(str,))),
-                    'sleep': fake.pybool(),
-                    'sleep_at': fake.date_time(tzinfo=timezone.utc),
-                    'title': fake.company(),
-                },
-                False,
-            ),
-        )
-        for payload, is_valid in cases:
-            run_full_update_patch_test(api.simulations, simulation_factory, payload, is_valid)
-
-    def test_create_from(self, api, simulation_factory, setup_mock_responses):
-        def _run_test_case(payload, is_valid):
-            endpoint_api = api.simulations
+    @pytest.mark.parametrize('payload,is_valid', _FULL_UPDATE_CASES)
+    def test_full_update(
+        self,
+        api,
+        run_full_update_patch_test,
+        resolve_placeholders,
+        simulation_factory,
+        worker_factory,
+        payload,
+        is_valid,
+    ):
+        payload = resolve_placeholders(payload, {'use_worker': lambda: worker_factory(api)})
+        run_full_update_patch_test(api.simulations, simulation_factory, payload, is_valid)
 
+    @pytest.mark.parametrize('payload,is_valid', _CREATE_FROM_CASES)
+    def test_create_from(
+        self, api, simulation_factory, setup_mock_responses, resolve_placeholders, tmp_path, payload, is_valid
+    ):
+        endpoint_api = api.simulations
+        with contextlib.ExitStack() as stack:
+            placeholders = {
+                'use_good_document_fd': lambda: stack.enter_context(_GOOD_DOCUMENT_PATH.open('r')),
+                'use_invalid_document_fd': lambda: stack.enter_context(_INVALID_DOCUMENT_PATH.open('r')),
+                'use_unexpected_document_fd': lambda: stack.enter_context(
+                    _UNEXPECTED_DOCUMENT_PATH.open('r')
+                ),
+                'use_non_existent_path': lambda: tmp_path / 'non_existent_file',
+            }
+            payload = resolve_placeholders(payload, placeholders)
             if is_valid:
                 expected_inst = simulation_factory(
                     endpoint_api.__api__, **{k: payload[k] for k in payload if k in ('title',)}
@@ -217,12 +414,12 @@ class TestSimulationEndpointApi:
                                 id=expected_inst.id,
                                 title=expected_inst.title,
                                 organization=str(expected_inst.organization.__pk__),
-                                organization_name=fake.slug(),
+                                organization_name=_SLUG,
                             ),
                             'status_code': HTTPStatus.CREATED,
                         },
                         ('GET', join_urls(endpoint_api.url, str(expected_inst.__pk__))): {
-                            'json': json.loads(expected_inst.json()),
+                            'json': to_serializable(expected_inst.dict()),
                             'status_code': HTTPStatus.OK,
                         },
                     }
@@ -235,167 +432,6 @@ class TestSimulationEndpointApi:
                     endpoint_api.create_from(**payload)
                 assert err.type in (TypeError, ValueError, json.JSONDecodeError, FileNotFoundError)
 
-        fixtures_directory = Path(__file__).parent / 'fixtures' / 'create_from' / 'json'
-        with (good_document_path := fixtures_directory / 'good_document.json').open(
-            'r'
-        ) as good_document_fd, (invalid_document_path := fixtures_directory / 'invalid_document.json').open(
-            'r'
-        ) as invalid_document_fd, (
-            unexpected_document_path := fixtures_directory / 'unexpected_document.json'
-        ).open('r') as unexpected_document_fd, tempfile.TemporaryDirectory() as temp_dir:
-            cases = (
-                # Empty Case
-                ({}, False),
-                # Minimal data case
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': {},
-                    },
-                    True,
-                ),
-                # Explicit `organization=None`
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'organization': None,
-                        'content': {},
-                    },
-                    True,
-                ),
-                # Assigned organization
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'organization': fake.slug(),
-                        'content': {},
-                    },
-                    True,
-                ),
-                # Full dictionary content
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': {
-                            'oob': False,
-                            'nodes': {'node-1': {'os': 'generic/ubuntu2204'}},
-                            'links': [
-                                [
-                                    {'node': 'node-1', 'interface': 'eth1'},
-                                    {'node': 'node-1', 'interface': 'eth2'},
-                                ]
-                            ],
-                        },
-                    },
-                    True,
-                ),
-                # Valid string content
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': '{}',
-                    },
-                    True,
-                ),
-                # Valid path content
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': good_document_path,
-                    },
-                    True,
-                ),
-                # Valid file descriptor content
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': good_document_fd,
-                    },
-                    True,
-                ),
-                # Invalid format
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'NOT_JSON',
-                        'content': {},
-                    },
-                    False,
-                ),
-                # Non-existent file at path
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': Path(temp_dir) / 'non_existent_file',
-                    },
-                    False,
-                ),
-                # Invalid content (inline string)
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': 'invalid content',
-                    },
-                    False,
-                ),
-                # Invalid content (path)
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': invalid_document_path,
-                    },
-                    False,
-                ),
-                # Invalid content (file descriptor)
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': invalid_document_fd,
-                    },
-                    False,
-                ),
-                # Unexpected content (inline string)
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': '[]',
-                    },
-                    False,
-                ),
-                # Unexpected content (path)
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': unexpected_document_path,
-                    },
-                    False,
-                ),
-                # Unexpected content (file descriptor)
-                (
-                    {
-                        'title': fake.slug(),
-                        'format': 'JSON',
-                        'content': unexpected_document_fd,
-                    },
-                    False,
-                ),
-            )
-            for payload, is_valid in cases:
-                _run_test_case(payload, is_valid)
-
     @pytest.mark.parametrize(
         'format,image_ids',
         itertools.product(
@@ -403,91 +439,75 @@ class TestSimulationEndpointApi:
             (True, False),
         ),
     )
-    def test_export(self, api, simulation_factory, setup_mock_responses, format, image_ids):
+    @pytest.mark.parametrize(
+        'payload,is_valid',
+        (
+            # Export via instance
+            ({'simulation': 'use_simulation'}, True),
+            # Export via UUID
+            ({'simulation': 'use_simulation_uuid'}, True),
+            # Export via string UUID
+            ({'simulation': 'use_simulation_str'}, True),
+            # Non-existing simulation
+            ({'simulation': 'use_non_existing_simulation'}, False),
+        ),
+    )
+    def test_export(
+        self,
+        api,
+        simulation_factory,
+        setup_mock_responses,
+        resolve_placeholders,
+        format,
+        image_ids,
+        payload,
+        is_valid,
+    ):
         endpoint_api = api.simulations
         expected_inst = simulation_factory(endpoint_api.__api__)
         non_existing_inst = simulation_factory(endpoint_api.__api__)
 
-        def _run_test_case(payload, is_valid):
-            if is_valid:
-                setup_mock_responses(
-                    {
-                        (
-                            'GET',
-                            join_urls(
-                                endpoint_api.url,
-                                str(expected_inst.__pk__),
-                                endpoint_api.EXPORT_PATH,
-                            )
-                            + f'?topology_format={format}&image_ids={str(image_ids).lower()}',
-                        ): {
-                            'json': air_sdk.v2.endpoints.simulations.TopologyFormat(
-                                title=expected_inst.title,
-                                format=format,
-                                organization=str(expected_inst.organization.__pk__),
-                                content=(content := {}),
-                            ),
-                            'status_code': HTTPStatus.OK,
-                        },
-                        (
-                            'GET',
-                            join_urls(
-                                endpoint_api.url,
-                                str(non_existing_inst.__pk__),
-                                endpoint_api.EXPORT_PATH,
-                            )
-                            + f'?topology_format={format}&image_ids={str(image_ids).lower()}',
-                        ): {
-                            'json': {},
-                            'status_code': HTTPStatus.NOT_FOUND,
-                        },
-                    }
-                )
-                inst = endpoint_api.export(**payload)
-                assert inst == content
-                assert inst is not content
-            else:
-                with pytest.raises(Exception) as err:
-                    endpoint_api.export(**payload)
-                assert err.type in (AirUnexpectedResponse,)
-
-        query_params = {
-            'format': format,
-            'image_ids': image_ids,
-        }
-        cases = (
-            # Export via instance
-            (
-                {
-                    'simulation': expected_inst,
-                    **query_params,
-                },
-                True,
-            ),
-            # Export via UUID
-            (
-                {
-                    'simulation': UUID(expected_inst.__pk__),
-                    **query_params,
-                },
-                True,
-            ),
-            # Export via string UUID
+        query_string = f'?topology_format={format}&image_ids={str(image_ids).lower()}'
+        content = {}
+        mock_responses = {
             (
-                {
-                    'simulation': str(expected_inst.__pk__),
-                    **query_params,
-                },
-                True,
-            ),
-            # Non-existing simulation
+                'GET',
+                join_urls(endpoint_api.url, str(expected_inst.__pk__), endpoint_api.EXPORT_PATH)
+                + query_string,
+            ): {
+                'json': air_sdk.v2.endpoints.simulations.TopologyFormat(
+                    title=expected_inst.title,
+                    format=format,
+                    organization=str(expected_inst.organization.__pk__),
+                    content=content,
+                ),
+                'status_code': HTTPStatus.OK,
+            },
             (
-                {
-                    'simulation': non_existing_inst.__pk__,
-                    **query_params,
-                },
-                False,
-            ),
+                'GET',
+                join_urls(endpoint_api.url, str(non_existing_inst.__pk__), endpoint_api.EXPORT_PATH)
+                + query_string,
+            ): {
+                'json': {},
+                'status_code': HTTPStatus.NOT_FOUND,
+            },
+        }
+        setup_mock_responses(mock_responses)
+
+        payload = resolve_placeholders(
+            {**payload, 'format': format, 'image_ids': image_ids},
+            {
+                'use_simulation': lambda: expected_inst,
+                'use_simulation_uuid': lambda: UUID(expected_inst.__pk__),
+                'use_simulation_str': lambda: str(expected_inst.__pk__),
+                'use_non_existing_simulation': lambda: non_existing_inst.__pk__,
+            },
         )
-        for payload, is_valid in cases:
-            _run_test_case(payload, is_valid)
+        if is_valid:
+            inst = endpoint_api.export(**payload)
+            assert inst == content
+            assert inst is not content
+        else:
+            with pytest.raises(Exception) as err:
+                endpoint_api.export(**payload)
+            assert err.type in (AirUnexpectedResponse,)
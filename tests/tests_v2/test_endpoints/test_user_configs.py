@@ -2,10 +2,26 @@
 # SPDX-License-Identifier: MIT
 
 import pytest
-import faker
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_UPDATE_CASES = (
+    ({}, True),
+    ({'name': None}, True),
+    ({'name': 'config-name'}, True),
+    ({'name': True}, False),
+    ({'content': None}, True),
+    ({'content': 'Lorem ipsum dolor sit amet.'}, True),
+    ({'content': 42}, False),
+    ({'name': 'config-name', 'content': 'config-content'}, True),
+    ({'fake_field': None}, False),
+)
+_FULL_UPDATE_CASES = (
+    ({}, False),
+    ({'name': None, 'content': None}, False),
+    ({'name': None, 'content': 'Lorem ipsum dolor sit amet.'}, False),
+    ({'name': 'config-name', 'content': None}, False),
+    ({'name': 'config-name', 'content': 'Lorem ipsum dolor sit amet.'}, True),
+    ({'name': 'config-name', 'content': 'Lorem ipsum dolor sit amet.', 'unexpected_field': 'value'}, False),
+)
 
 
 class TestUserConfigEndpointApi:
@@ -23,17 +39,17 @@ class TestUserConfigEndpointApi:
         (
             ({}, False),
             ({'name': None, 'kind': None, 'content': None}, False),
-            ({'name': fake.slug(), 'kind': fake.slug(), 'content': fake.binary()}, False),
-            ({'name': fake.slug(), 'kind': fake.slug(), 'content': fake.slug()}, True),
+            ({'name': 'config-name', 'kind': 'config-kind', 'content': b'config-content'}, False),
+            ({'name': 'config-name', 'kind': 'config-kind', 'content': 'config-content'}, True),
             (
-                {'name': fake.slug(), 'kind': fake.slug(), 'content': fake.slug(), 'owner': fake.pyint()},
+                {'name': 'config-name', 'kind': 'config-kind', 'content': 'config-content', 'owner': 42},
                 False,
             ),
             (
                 {
-                    'name': fake.slug(),
-                    'kind': fake.slug(),
-                    'content': fake.slug(),
+                    'name': 'other-config-name',
+                    'kind': 'other-config-kind',
+                    'content': 'other-config-content',
                 },
                 True,
             ),
@@ -43,43 +59,13 @@ class TestUserConfigEndpointApi:
         """This tests that the data provided is properly validated and used."""
         run_create_test_case(api.user_configs, user_config_factory, payload, is_valid)
 
-    def test_update(
-        self,
-        api,
-        run_update_patch_test,
-        user_config_factory,
-    ):
-        cases = (
-            ({}, True),
-            ({'name': None}, True),
-            ({'name': fake.slug()}, True),
-            ({'name': fake.pybool()}, False),
-            ({'content': None}, True),
-            ({'content': fake.text()}, True),
-            ({'content': fake.pyint()}, False),
-            ({'name': fake.slug(), 'content': fake.slug()}, True),
-            ({'fake_field': None}, False),
-        )
-        for payload, is_valid in cases:
-            run_update_patch_test(api.user_configs, user_config_factory, payload, is_valid)
+    @pytest.mark.parametrize('payload,is_valid', _UPDATE_CASES)
+    def test_update(self, api, run_update_patch_test, user_config_factory, payload, is_valid):
+        run_update_patch_test(api.user_configs, user_config_factory, payload, is_valid)
 
-    def test_full_update(
-        self,
-        api,
-        run_full_update_put_test,
-        user_config_factory,
-        organization_factory,
-    ):
-        cases = (
-            ({}, False),
-            ({'name': None, 'content': None}, False),
-            ({'name': None, 'content': fake.text()}, False),
-            ({'name': fake.slug(), 'content': None}, False),
-            ({'name': fake.slug(), 'content': fake.text()}, True),
-            ({'name': fake.slug(), 'content': fake.text(), 'unexpected_field': fake.slug()}, False),
-        )
-        for payload, is_valid in cases:
-            run_full_update_put_test(api.user_configs, user_config_factory, payload, is_valid)
+    @pytest.mark.parametrize('payload,is_valid', _FULL_UPDATE_CASES)
+    def test_full_update(self, api, run_full_update_put_test, user_config_factory, payload, is_valid):
+        run_full_update_put_test(api.user_configs, user_config_factory, payload, is_valid)
 
 
 class TestUserConfigModelRelations:
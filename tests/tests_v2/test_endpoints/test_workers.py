@@ -3,13 +3,11 @@
 from http import HTTPStatus
 
 import pytest
-import faker
 
 from air_sdk.v2 import AirModelAttributeError
 from air_sdk.v2.utils import join_urls
 
-faker.Faker.seed(0)
-fake = faker.Faker()
+_VERSION = '1.2.3'
 
 
 class TestWorkerEndpointApi:
@@ -19,11 +17,11 @@ class TestWorkerEndpointApi:
     @pytest.mark.parametrize(
         'contact,is_valid',
         (
-            (fake.email(), True),
-            (fake.pylist(value_types=(str,)), True),
-            (fake.pydict(value_types=(str,)), True),
+            ('worker-admin@example.com', True),
+            (['worker-admin@example.com', 'Acme Corp'], True),
+            ({'email': 'worker-admin@example.com', 'team': 'Acme Corp'}, True),
             (None, False),
-            (fake.pyint(), False),
+            (42, False),
         ),
     )
     def test_contact_field_response(self, api, worker_factory, contact, is_valid):
@@ -48,25 +46,25 @@ class TestWorkerEndpointApi:
         'payload,is_valid',
         (
             ({}, True),
-            ({'invalid_key': fake.slug()}, False),
-            ({'airstrike_version': fake.slug()}, True),
-            ({'architecture': fake.slug()}, True),
-            ({'docker': fake.slug()}, True),
-            ({'kernel': fake.slug()}, True),
-            ({'libvirt': fake.slug()}, True),
-            ({'operating_system': fake.slug()}, True),
-            ({'proxy_image': fake.slug()}, True),
-            ({'worker_version': fake.slug()}, True),
+            ({'invalid_key': _VERSION}, False),
+            ({'airstrike_version': _VERSION}, True),
+            ({'architecture': _VERSION}, True),
+            ({'docker': _VERSION}, True),
+            ({'kernel': _VERSION}, True),
+            ({'libvirt': _VERSION}, True),
+            ({'operating_system': _VERSION}, True),
+            ({'proxy_image': _VERSION}, True),
+            ({'worker_version': _VERSION}, True),
             (
                 {
-                    'airstrike_version': fake.slug(),
-                    'architecture': fake.slug(),
-                    'docker': fake.slug(),
-                    'kernel': fake.slug(),
-                    'libvirt': fake.slug(),
-                    'operating_system': fake.slug(),
-                    'proxy_image': fake.slug(),
-                    'worker_version': fake.slug(),
+                    'airstrike_version': _VERSION,
+                    'architecture': _VERSION,
+                    'docker': _VERSION,
+                    'kernel': _VERSION,
+                    'libvirt': _VERSION,
+                    'operating_system': _VERSION,
+                    'proxy_image': _VERSION,
+                    'worker_version': _VERSION,
                 },
                 True,
             ),
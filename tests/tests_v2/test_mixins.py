@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022-2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+import json
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from uuid import UUID
+
+import pytest
+
+from air_sdk.v2.endpoints.mixins import serialize_payload, to_serializable
+
+_UUID = UUID('3f2b8c1e-7d4a-4e9b-9c6f-1a2b3c4d5e6f')
+_DATETIME = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class _Color(str, Enum):
+    RED = 'red'
+
+
+class _Size(IntEnum):
+    SMALL = 1
+
+
+class TestToSerializable:
+    @pytest.mark.parametrize(
+        'data',
+        (
+            {'id': _UUID},
+            {'created': _DATETIME},
+            {'nested': [_UUID, (_DATETIME, [None, True, 1.5])]},
+            ({'id': _UUID}, [{'created': _DATETIME}]),
+            {1: 'one', 2.5: 'two and a half', True: 'yes', None: 'nothing'},
+            {'color': _Color.RED, 'size': _Size.SMALL, 'sizes': [_Size.SMALL]},
+            {_Color.RED: 'red', _Size.SMALL: 'small'},
+        ),
+    )
+    def test_matches_json_round_trip(self, data):
+        result = to_serializable(data)
+        expected = json.loads(serialize_payload(data))
+        assert result == expected
+        # Enum members compare equal to their values, so compare the reprs as well
+        assert repr(result) == repr(expected)
+
+    def test_air_model(self, api, simulation_factory):
+        simulation = simulation_factory(api)
+        data = {'simulation': simulation, 'simulations': [simulation]}
+        assert to_serializable(data) == json.loads(serialize_payload(data))
+
+    def test_model_dict(self, api, simulation_factory):
+        data = simulation_factory(api).dict()
+        assert to_serializable(data) == json.loads(serialize_payload(data))
+
+    def test_unsupported_key(self):
+        with pytest.raises(TypeError):
+            serialize_payload({_UUID: 'value'})
+        with pytest.raises(TypeError):
+            to_serializable({_UUID: 'value'})
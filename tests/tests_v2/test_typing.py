@@ -6,10 +6,7 @@ from typing import TypedDict, Union, List, Dict
 from dataclasses import dataclass
 from air_sdk.v2 import typing
 
-import faker
-
-faker.Faker.seed(0)
-fake = faker.Faker()
+_SLUGS = ('alpha-one', 'bravo-two', 'charlie-three')
 
 
 class ExampleTypedDict(TypedDict):
@@ -43,9 +40,9 @@ class TestTypingMethods:
     @pytest.mark.parametrize(
         'value,expected',
         [
-            ({'field1': fake.pyint(), 'field2': fake.slug()}, True),
-            ({'field1': fake.pyint()}, False),
-            ({'field1': str(fake.pyint()), 'field2': fake.slug()}, False),
+            ({'field1': 7, 'field2': _SLUGS[0]}, True),
+            ({'field1': 7}, False),
+            ({'field1': '7', 'field2': _SLUGS[0]}, False),
         ],
     )
     def test_type_check_typed_dict(self, value, expected):
@@ -56,15 +53,15 @@ class TestTypingMethods:
         [
             (
                 {
-                    'field1': {'field1': fake.pyint(), 'field2': fake.slug()},
-                    'field2': [fake.slug(), fake.slug()],
+                    'field1': {'field1': 7, 'field2': _SLUGS[0]},
+                    'field2': list(_SLUGS[1:]),
                 },
                 True,
             ),
             (
                 {
-                    'field1': {'field1': fake.pyint(), 'field2': fake.pyint()},
-                    'field2': [fake.slug(), fake.slug()],
+                    'field1': {'field1': 7, 'field2': 8},
+                    'field2': list(_SLUGS[1:]),
                 },
                 False,
             ),
@@ -87,7 +84,7 @@ class TestTypingMethods:
         'value,expected',
         [
             (123, True),
-            (fake.slug(), True),
+            (_SLUGS[0], True),
             (123.45, False),
         ],
     )